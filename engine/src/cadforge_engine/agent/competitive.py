@@ -21,9 +21,15 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Any, AsyncGenerator
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # orjson not installed — stdlib parser
+
 from cadforge_engine.agent.llm import LiteLLMSubagentClient
 from cadforge_engine.agent.pipeline import CODER_TOOLS, _handle_coder_tool
 from cadforge_engine.models.competitive import (
@@ -153,23 +159,25 @@ Output valid JSON:
 # Helper: parse JSON from LLM response text
 # ---------------------------------------------------------------------------
 
+# Any line that opens or closes a markdown code fence (```json, ```, ...)
+_FENCE_LINE_RE = re.compile(r"^[ \t]*```.*\n?", re.MULTILINE)
+
+
 def _extract_json(text: str) -> dict[str, Any]:
     """Extract JSON from LLM response, handling markdown code fences."""
     text = text.strip()
     if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last lines (fences)
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
+        # Remove fence lines in a single pass
+        text = _FENCE_LINE_RE.sub("", text)
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
         # Try to find JSON object in the text
         start = text.find("{")
         end = text.rfind("}") + 1
         if start >= 0 and end > start:
             try:
-                return json.loads(text[start:end])
+                return _json_loads(text[start:end])
             except json.JSONDecodeError:
                 pass
     return {}
@@ -326,9 +334,14 @@ def _evaluate_proposal(
             eval_result.stl_path = str(output_path)
 
             # Analyze mesh
+            mesh = None
             try:
-                from cadforge_engine.domain.analyzer import analyze_mesh, run_dfm_check
-                analysis = analyze_mesh(output_path)
+                from cadforge_engine.domain.analyzer import (
+                    analyze_mesh, load_mesh, run_dfm_check,
+                )
+                # Parse the STL once; the FEA stub below reuses it too
+                mesh = load_mesh(output_path)
+                analysis = analyze_mesh(output_path, mesh=mesh)
                 eval_result.is_watertight = bool(analysis.is_watertight)
                 eval_result.volume_mm3 = float(analysis.volume_mm3)
                 eval_result.surface_area_mm2 = float(analysis.surface_area_mm2)
@@ -337,7 +350,7 @@ def _evaluate_proposal(
                 }
                 eval_result.center_of_mass = [float(v) for v in analysis.center_of_mass]
 
-                dfm = run_dfm_check(output_path)
+                dfm = run_dfm_check(output_path, mesh=mesh)
                 eval_result.dfm_issues = dfm.issues
                 eval_result.dfm_report_data = dfm.to_dict()
             except Exception as e:
@@ -346,7 +359,7 @@ def _evaluate_proposal(
             # FEA stub
             try:
                 from cadforge_engine.domain.analyzer import run_fea_stub
-                fea = run_fea_stub(output_path)
+                fea = run_fea_stub(output_path, mesh=mesh)
                 eval_result.fea_risk_level = fea.risk_level
                 eval_result.fea_risk_score = fea.risk_score
                 eval_result.fea_notes = fea.notes
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class MeshAnalysis:
@@ -38,7 +40,7 @@ class MeshAnalysis:
             "triangle_count": int(self.triangle_count),
             "vertex_count": int(self.vertex_count),
             "bounding_box": {k: float(v) for k, v in self.bounding_box.items()},
-            "center_of_mass": [float(round(c, 2)) for c in self.center_of_mass],
+            "center_of_mass": np.round(self.center_of_mass, 2).tolist(),
             "issues": self.issues,
         }
 
@@ -88,7 +90,7 @@ class GeometricDiff:
             "volume_delta_pct": float(round(self.volume_delta_pct, 2)),
             "surface_area_delta_mm2": float(round(self.surface_area_delta_mm2, 2)),
             "bbox_size_delta": {k: float(round(v, 2)) for k, v in self.bbox_size_delta.items()},
-            "center_of_mass_delta": [float(round(c, 2)) for c in self.center_of_mass_delta],
+            "center_of_mass_delta": np.round(self.center_of_mass_delta, 2).tolist(),
         }
 
 
@@ -132,6 +134,20 @@ class FEAStubResult:
         }
 
 
+def load_mesh(path: Path) -> Any:
+    """Load *path* as a single ``trimesh.Trimesh``.
+
+    Callers running several checks on one file can load it once and pass
+    the mesh to each of them.
+    """
+    import trimesh
+
+    # force="mesh" unwraps single-geometry scenes without a concatenate copy.
+    # Processing stays on: STL stores per-triangle vertices, which must be
+    # merged before watertightness and volume mean anything.
+    return trimesh.load(str(path), force="mesh")
+
+
 def compare_meshes(path_a: Path, path_b: Path) -> GeometricDiff:
     """Compare two STL files using existing analyze_mesh().
 
@@ -162,24 +178,20 @@ def compare_meshes(path_a: Path, path_b: Path) -> GeometricDiff:
     )
 
 
-def analyze_mesh(path: Path) -> MeshAnalysis:
+def analyze_mesh(path: Path, mesh: Any = None) -> MeshAnalysis:
     """Analyze an STL/3MF mesh file.
 
     Args:
         path: Path to the mesh file
+        mesh: Already-loaded mesh for *path*, or None to load it
 
     Returns:
         MeshAnalysis with geometry metrics and issue detection
     """
-    import trimesh
-
-    mesh = trimesh.load(str(path))
-    if isinstance(mesh, trimesh.Scene):
-        # Combine all geometries
-        meshes = list(mesh.geometry.values())
-        if not meshes:
-            return MeshAnalysis(file_path=str(path), issues=["Empty scene"])
-        mesh = trimesh.util.concatenate(meshes)
+    if mesh is None:
+        mesh = load_mesh(path)
+    if len(mesh.faces) == 0:
+        return MeshAnalysis(file_path=str(path), issues=["Empty scene"])
 
     analysis = MeshAnalysis(file_path=str(path))
     analysis.is_watertight = bool(mesh.is_watertight)
@@ -188,20 +200,21 @@ def analyze_mesh(path: Path) -> MeshAnalysis:
     analysis.triangle_count = len(mesh.faces)
     analysis.vertex_count = len(mesh.vertices)
 
-    bounds = mesh.bounds
+    # One C-level copy per corner instead of nine numpy scalar extractions
+    (min_x, min_y, min_z), (max_x, max_y, max_z) = mesh.bounds.tolist()
     analysis.bounding_box = {
-        "min_x": float(bounds[0][0]),
-        "min_y": float(bounds[0][1]),
-        "min_z": float(bounds[0][2]),
-        "max_x": float(bounds[1][0]),
-        "max_y": float(bounds[1][1]),
-        "max_z": float(bounds[1][2]),
-        "size_x": float(bounds[1][0] - bounds[0][0]),
-        "size_y": float(bounds[1][1] - bounds[0][1]),
-        "size_z": float(bounds[1][2] - bounds[0][2]),
+        "min_x": min_x,
+        "min_y": min_y,
+        "min_z": min_z,
+        "max_x": max_x,
+        "max_y": max_y,
+        "max_z": max_z,
+        "size_x": max_x - min_x,
+        "size_y": max_y - min_y,
+        "size_z": max_z - min_z,
     }
 
-    analysis.center_of_mass = list(mesh.center_mass)
+    analysis.center_of_mass = mesh.center_mass.tolist()
 
     # Issue detection
     if not mesh.is_watertight:
@@ -239,6 +252,7 @@ def run_dfm_check(
     build_volume: tuple[float, float, float] | None = None,
     min_wall_thickness: float = 0.8,
     max_overhang_angle: float = 45.0,
+    mesh: Any = None,
 ) -> DFMReport:
     """Run a Design for Manufacturing check on a mesh.
 
@@ -247,39 +261,34 @@ def run_dfm_check(
         build_volume: (x, y, z) build volume in mm, or None to skip
         min_wall_thickness: Minimum wall thickness in mm
         max_overhang_angle: Maximum overhang angle from vertical in degrees
+        mesh: Already-loaded mesh for *path*, or None to load it
 
     Returns:
         DFMReport with issues and suggestions
     """
-    import numpy as np
-    import trimesh
-
     report = DFMReport()
-    mesh = trimesh.load(str(path))
-    if isinstance(mesh, trimesh.Scene):
-        meshes = list(mesh.geometry.values())
-        if not meshes:
-            report.issues.append("Empty mesh file")
-            return report
-        mesh = trimesh.util.concatenate(meshes)
+    if mesh is None:
+        mesh = load_mesh(path)
+    if len(mesh.faces) == 0:
+        report.issues.append("Empty mesh file")
+        return report
 
     # Build volume check
     if build_volume:
         bounds = mesh.bounds
-        size = bounds[1] - bounds[0]
-        if size[0] > build_volume[0] or size[1] > build_volume[1] or size[2] > build_volume[2]:
+        sx, sy, sz = (bounds[1] - bounds[0]).tolist()
+        if sx > build_volume[0] or sy > build_volume[1] or sz > build_volume[2]:
             report.build_volume_ok = False
             report.issues.append(
-                f"Model size ({size[0]:.1f} x {size[1]:.1f} x {size[2]:.1f}mm) "
+                f"Model size ({sx:.1f} x {sy:.1f} x {sz:.1f}mm) "
                 f"exceeds build volume ({build_volume[0]} x {build_volume[1]} x {build_volume[2]}mm)"
             )
             report.suggestions.append("Scale down or split the model")
 
     # Overhang check using face normals
     if len(mesh.face_normals) > 0:
-        z_component = mesh.face_normals[:, 2]
-        overhang_threshold = -np.cos(np.radians(max_overhang_angle))
-        overhang_faces = np.sum(z_component < overhang_threshold)
+        overhang_threshold = float(-np.cos(np.radians(max_overhang_angle)))
+        overhang_faces = int(np.count_nonzero(mesh.face_normals[:, 2] < overhang_threshold))
         overhang_ratio = overhang_faces / len(mesh.faces)
         if overhang_ratio > 0.05:
             report.overhang_ok = False
@@ -332,8 +341,6 @@ def _check_wall_thickness(
         (thin_count, total_sampled, thin_locations) where thin_locations
         is a list of [x, y, z] points that are too thin.
     """
-    import numpy as np
-
     if not mesh.is_watertight:
         return (0, 0, [])
 
@@ -504,6 +511,7 @@ def compute_algorithmic_fidelity(
 def run_fea_stub(
     path: Path,
     min_wall_thickness: float = 0.8,
+    mesh: Any = None,
 ) -> FEAStubResult:
     """Run a lightweight structural risk assessment on a mesh.
 
@@ -513,23 +521,19 @@ def run_fea_stub(
     Args:
         path: Path to mesh file.
         min_wall_thickness: Minimum wall thickness in mm.
+        mesh: Already-loaded mesh for *path*, or None to load it.
 
     Returns:
         FEAStubResult with risk level and contributing factors.
     """
-    import numpy as np
-    import trimesh
-
     result = FEAStubResult()
     score = 0.0
 
-    mesh = trimesh.load(str(path))
-    if isinstance(mesh, trimesh.Scene):
-        meshes = list(mesh.geometry.values())
-        if not meshes:
-            result.notes.append("Empty mesh — cannot assess risk")
-            return result
-        mesh = trimesh.util.concatenate(meshes)
+    if mesh is None:
+        mesh = load_mesh(path)
+    if len(mesh.faces) == 0:
+        result.notes.append("Empty mesh — cannot assess risk")
+        return result
 
     # --- Thin sections ---
     if mesh.is_watertight:
@@ -76,16 +76,16 @@ def export_3mf(workpiece: Any, name: str, output_dir: Path) -> Path:
     Returns:
         Path to the exported file
     """
+    import cadquery as cq
+
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"{name}.3mf"
 
     try:
-        import cadquery as cq
         cq.exporters.export(workpiece, str(path), exportType="3MF")
     except (ValueError, AttributeError):
         # 3MF not supported in this CadQuery version, fall back to STL
         path = output_dir / f"{name}.stl"
-        import cadquery as cq
         cq.exporters.export(workpiece, str(path), exportType="STL")
 
     return path
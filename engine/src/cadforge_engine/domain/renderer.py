@@ -34,9 +34,10 @@ def render_stl_to_png(
     Returns:
         List of paths to generated PNG files.
     """
-    import trimesh
     import pyrender
 
+    from cadforge_engine.domain.analyzer import load_mesh
+
     import os
     import platform as plat
 
@@ -44,13 +45,10 @@ def render_stl_to_png(
     if plat.system() != "Darwin":
         os.environ.setdefault("PYOPENGL_PLATFORM", "osmesa")
 
-    mesh = trimesh.load(str(stl_path))
-    if isinstance(mesh, trimesh.Scene):
-        meshes = list(mesh.geometry.values())
-        if not meshes:
-            logger.warning("Empty mesh file: %s", stl_path)
-            return []
-        mesh = trimesh.util.concatenate(meshes)
+    mesh = load_mesh(stl_path)
+    if len(mesh.faces) == 0:
+        logger.warning("Empty mesh file: %s", stl_path)
+        return []
 
     # Build pyrender scene
     pr_mesh = pyrender.Mesh.from_trimesh(
@@ -7,7 +7,6 @@ Persists to .cadforge/competitive/{id}.json for crash-safe storage.
 
 from __future__ import annotations
 
-import json
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
@@ -156,9 +155,10 @@ class CompetitiveDesignStore:
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return CompetitiveDesignSpec(**data)
-        except (json.JSONDecodeError, OSError, ValueError):
+            # Validate straight from bytes — pydantic-core parses the JSON itself,
+            # skipping the intermediate json.loads() dict and **kwargs rebuild.
+            return CompetitiveDesignSpec.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
             return None
 
     def list_all(self) -> list[CompetitiveDesignSpec]:
@@ -166,8 +166,7 @@ class CompetitiveDesignStore:
         designs = []
         for p in sorted(self._dir.glob("*.json"), reverse=True):
             try:
-                data = json.loads(p.read_text(encoding="utf-8"))
-                designs.append(CompetitiveDesignSpec(**data))
-            except (json.JSONDecodeError, OSError, ValueError):
+                designs.append(CompetitiveDesignSpec.model_validate_json(p.read_bytes()))
+            except (OSError, ValueError):
                 continue
         return designs
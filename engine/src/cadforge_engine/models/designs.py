@@ -7,7 +7,6 @@ Persists to .cadforge/designs/{id}.json for crash-safe, human-readable storage.
 
 from __future__ import annotations
 
-import json
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
@@ -76,9 +75,8 @@ class DesignStore:
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return DesignSpec(**data)
-        except (json.JSONDecodeError, OSError, ValueError):
+            return DesignSpec.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
             return None
 
     def list_all(self) -> list[DesignSpec]:
@@ -86,9 +84,8 @@ class DesignStore:
         designs = []
         for p in sorted(self._dir.glob("*.json"), reverse=True):
             try:
-                data = json.loads(p.read_text(encoding="utf-8"))
-                designs.append(DesignSpec(**data))
-            except (json.JSONDecodeError, OSError, ValueError):
+                designs.append(DesignSpec.model_validate_json(p.read_bytes()))
+            except (OSError, ValueError):
                 continue
         return designs
 
@@ -36,7 +36,11 @@ def scrape_url(url: str, source_name: str = "") -> list[VaultChunk]:
         logger.warning("Failed to fetch %s: %s", url, e)
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Parse the raw bytes so the body is decoded once, by BeautifulSoup, using
+    # the header charset when sent and <meta charset> sniffing otherwise.
+    soup = BeautifulSoup(
+        response.content, "html.parser", from_encoding=response.charset_encoding,
+    )
 
     # Remove nav, sidebar, footer, etc.
     for tag in soup.find_all(["nav", "footer", "script", "style", "aside"]):
@@ -0,0 +1,50 @@
+"""Shared pytest configuration for the engine test suite."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from cadforge_engine.app import create_app
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="also run tests marked @pytest.mark.slow",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip ``slow`` tests unless ``--run-slow`` is given.
+
+    Fast gate:        pytest -n auto
+    Integration job:  pytest -n auto --run-slow -m slow
+    """
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test — pass --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> TestClient:
+    """Shared client for side-effect-free route tests."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app: FastAPI) -> httpx.ASGITransport:
+    """In-process ASGI transport for ``httpx.AsyncClient`` — no worker thread."""
+    return httpx.ASGITransport(app=app)
@@ -0,0 +1,28 @@
+"""Shared helpers for the engine test suite."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Collection
+from contextlib import aclosing
+from typing import Any
+
+
+async def collect_events(
+    stream: AsyncGenerator[dict[str, Any], None],
+    until: str | Collection[str] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Drain an SSE-style event stream, closing it on the way out.
+
+    Stops once every event name in *until* has been seen (a single name
+    stops at its first occurrence), or after *limit* events.
+    """
+    targets = {until} if isinstance(until, str) else set(until or ())
+    events: list[dict[str, Any]] = []
+    async with aclosing(stream):
+        async for event in stream:
+            events.append(event)
+            targets.discard(event["event"])
+            if (until is not None and not targets) or len(events) == limit:
+                break
+    return events
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,14 +10,14 @@ import numpy as np
 import pytest
 
 from cadforge_engine.domain.analyzer import (
-    AlgorithmicFidelityResult,
-    DFMReport,
-    FEAStubResult,
     GeometricDiff,
     MeshAnalysis,
     _check_wall_thickness,
+    analyze_mesh,
     compute_algorithmic_fidelity,
     compare_meshes,
+    load_mesh,
+    run_dfm_check,
     run_fea_stub,
 )
 
@@ -39,6 +40,42 @@ def _make_analysis(
     )
 
 
+@pytest.mark.skipif(importlib.util.find_spec("trimesh") is None, reason="trimesh not installed")
+class TestAnalyzeMesh:
+    def test_box_stl(self, tmp_path: Path):
+        import trimesh
+
+        path = tmp_path / "box.stl"
+        trimesh.creation.box((10, 20, 30)).export(path)
+
+        analysis = analyze_mesh(path)
+        assert analysis.is_watertight is True
+        assert analysis.volume_mm3 == pytest.approx(6000.0)
+        assert analysis.vertex_count == 8
+        assert analysis.bounding_box["size_z"] == pytest.approx(30.0)
+        assert analysis.issues == []
+
+    def test_empty_stl(self, tmp_path: Path):
+        path = tmp_path / "empty.stl"
+        path.write_text("solid empty\nendsolid empty\n")
+
+        assert analyze_mesh(path).issues == ["Empty scene"]
+
+    def test_preloaded_mesh_matches_file_load(self, tmp_path: Path):
+        import trimesh
+
+        path = tmp_path / "box.stl"
+        trimesh.creation.box((10, 10, 10)).export(path)
+
+        mesh = load_mesh(path)
+        assert analyze_mesh(path, mesh=mesh) == analyze_mesh(path)
+        # rtree is optional, so leave the ray-based wall check out
+        assert (
+            run_dfm_check(path, min_wall_thickness=0, mesh=mesh).to_dict()
+            == run_dfm_check(path, min_wall_thickness=0).to_dict()
+        )
+
+
 class TestGeometricDiff:
     def test_to_dict(self):
         diff = GeometricDiff(
@@ -7,17 +7,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pytest
 from fastapi.testclient import TestClient
 
-from cadforge_engine.app import create_app
-
-
-@pytest.fixture
-def client() -> TestClient:
-    app = create_app()
-    return TestClient(app)
-
 
 def test_cadquery_missing_dependency(client: TestClient, tmp_path: Path) -> None:
     """Test that CadQuery route handles missing cadquery gracefully."""
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
+from contextlib import aclosing
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -25,6 +25,8 @@ from cadforge_engine.agent.competitive import (
     _extract_text,
 )
 
+from .helpers import collect_events
+
 
 # ---------------------------------------------------------------------------
 # Test data models
@@ -90,6 +92,12 @@ class TestCompetitiveDesignStore:
         store = CompetitiveDesignStore(tmp_path)
         assert store.get("nonexistent") is None
 
+    def test_get_corrupt_file(self, tmp_path: Path):
+        store = CompetitiveDesignStore(tmp_path)
+        store._path("broken").write_text("{not json", encoding="utf-8")
+        assert store.get("broken") is None
+        assert store.list_all() == []
+
     def test_list_all(self, tmp_path: Path):
         store = CompetitiveDesignStore(tmp_path)
         d1 = CompetitiveDesignSpec(title="First", prompt="p1")
@@ -221,6 +229,21 @@ def _noop_evaluate_proposal(proposal, project_root, previous_stl=None):
     )
 
 
+# Pre-serialized JSON payloads shared by several mock handlers.
+# _LEARNER_EMPTY_JSON == json.dumps({"patterns": [], "anti_patterns": [], "key_insights": []})
+_LEARNER_EMPTY_JSON = '{"patterns": [], "anti_patterns": [], "key_insights": []}'
+
+
+class _FakeClient:
+    """Plain stand-in for ``LiteLLMSubagentClient`` — avoids MagicMock overhead."""
+
+    __slots__ = ("model", "acall")
+
+    def __init__(self, acall, model: str = "test/model"):
+        self.model = model
+        self.acall = acall
+
+
 # Shared patch targets for all graph integration tests
 _GRAPH_PATCHES = [
     "cadforge_engine.agent.competitive_graph.LiteLLMSubagentClient",
@@ -228,25 +251,69 @@ _GRAPH_PATCHES = [
 ]
 
 
+@pytest.fixture(scope="class")
+def graph_client():
+    """Patch the graph's LLM client and sandbox once per test class.
+
+    Tests set ``graph_client.return_value`` to a ``_FakeClient``.
+    """
+    with patch(_GRAPH_PATCHES[0]) as MockClient, \
+         patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
+        yield MockClient
+
+
+async def _run_graph(
+    graph_client,
+    mock_acall,
+    tmp_path: Path,
+    design: CompetitiveDesignSpec,
+    config: dict[str, Any],
+    max_rounds: int = 1,
+) -> tuple[list[dict[str, Any]], CompetitiveDesignStore]:
+    """Save *design*, run the graph against *mock_acall*, return (events, store)."""
+    from cadforge_engine.agent.competitive_graph import run_competitive_graph
+
+    store = CompetitiveDesignStore(tmp_path)
+    store.save(design)
+    graph_client.return_value = _FakeClient(mock_acall)
+
+    events = []
+    async for event in run_competitive_graph(
+        design=design, store=store, project_root=tmp_path,
+        pipeline_config=config, max_rounds=max_rounds,
+    ):
+        events.append(event)
+    return events, store
+
+
+async def _graph_sse_events(stream) -> AsyncGenerator[dict[str, Any], None]:
+    """Flatten the ``sse_events`` emitted by each node of a graph ``astream``."""
+    async with aclosing(stream):
+        async for chunk in stream:
+            for output in chunk.values():
+                if isinstance(output, dict):
+                    for ev in output.get("sse_events", []):
+                        yield ev
+
+
 class TestGraphSupervisor:
     @pytest.mark.asyncio
-    async def test_supervisor_parses_spec(self, tmp_path: Path):
+    async def test_supervisor_parses_spec(self, tmp_path: Path, graph_client):
         """Supervisor node should produce golden spec + key constraints."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(
             title="Test Box",
             prompt="Create a 50mm cube",
         )
-        store.save(design)
 
-        supervisor_response = _mock_llm_response(json.dumps({
-            "golden_spec": "A cube measuring 50mm on each side",
-            "key_constraints": ["exact 50mm dimensions", "sharp edges"],
-            "critical_dimensions": {"side_length": "50mm"},
-            "manufacturing_notes": "Simple geometry, no supports needed",
-        }))
+        supervisor_response = _mock_llm_response(
+            '{"golden_spec": "A cube measuring 50mm on each side", '
+            '"key_constraints": ["exact 50mm dimensions", "sharp edges"], '
+            '"critical_dimensions": {"side_length": "50mm"}, '
+            '"manufacturing_notes": "Simple geometry, no supports needed"}'
+        )
+
+        async def mock_acall(messages, system, tools):
+            return supervisor_response
 
         config = {
             "supervisor": {"model": "test/supervisor"},
@@ -257,20 +324,7 @@ class TestGraphSupervisor:
             "debate_enabled": False,
         }
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            instance = MagicMock()
-            instance.model = "test/supervisor"
-            instance.acall = AsyncMock(return_value=supervisor_response)
-            instance.call = MagicMock(return_value=supervisor_response)
-            MockClient.return_value = instance
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                events.append(event)
+        events, _ = await _run_graph(graph_client, mock_acall, tmp_path, design, config)
 
         # Should have supervisor events
         supervisor_events = [e for e in events if e["event"] == "competitive_supervisor"]
@@ -279,29 +333,24 @@ class TestGraphSupervisor:
 
 class TestGraphProposals:
     @pytest.mark.asyncio
-    async def test_partial_failure_tolerated(self, tmp_path: Path):
+    async def test_partial_failure_tolerated(self, tmp_path: Path, graph_client):
         """If some proposals fail, pipeline should continue with valid ones."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(
             title="Test", prompt="Make a box",
             specification="A 50mm cube",
         )
-        store.save(design)
 
         async def mock_acall(messages, system, tools):
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "50mm cube",
-                    "key_constraints": [],
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 50, "text_similarity": 60,
-                    "geometric_accuracy": 40, "manufacturing_viability": 50,
-                    "reasoning": "Needs work",
-                }))
+            s = system.lower()
+            if "supervisor" in s:
+                return _mock_llm_response(
+                    '{"golden_spec": "50mm cube", "key_constraints": []}'
+                )
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(
+                    '{"score": 50, "text_similarity": 60, "geometric_accuracy": 40, '
+                    '"manufacturing_viability": 50, "reasoning": "Needs work"}'
+                )
             # Coder returns text-only = code captured
             return _mock_llm_response("Here is my code: result = cq.Workplane().box(50,50,50)")
 
@@ -314,22 +363,7 @@ class TestGraphProposals:
             "debate_enabled": False,
         }
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            mock.call = MagicMock(return_value=_mock_llm_response(json.dumps({
-                "golden_spec": "50mm cube", "key_constraints": [],
-            })))
-            MockClient.return_value = mock
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                events.append(event)
+        events, _ = await _run_graph(graph_client, mock_acall, tmp_path, design, config)
 
         # Should have proposal events
         proposal_events = [e for e in events if e["event"] == "competitive_proposal"]
@@ -346,32 +380,41 @@ class TestFidelityScoring:
         assert fs2.passed is False
 
 
-class TestGraphForcedRevert:
+class TestGraphRoundOutcome:
     @pytest.mark.asyncio
-    async def test_forced_revert_on_low_score(self, tmp_path: Path):
-        """All scores < threshold should trigger another round."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
+    @pytest.mark.parametrize("score,max_rounds,event_name,final_status", [
+        # All scores < threshold should trigger another round, then fail
+        (50, 2, "competitive_status", "failed"),
+        # When one proposal passes, it should be selected
+        (97, 1, "competitive_merger", "completed"),
+    ])
+    async def test_judge_score_decides_outcome(
+        self, tmp_path: Path, graph_client,
+        score, max_rounds, event_name, final_status,
+    ):
+        """The judge's score decides between forced revert and merger."""
         design = CompetitiveDesignSpec(
             title="Test", prompt="Make a box",
         )
-        store.save(design)
+
+        judge_json = (
+            f'{{"score": {score}, "text_similarity": {score}, '
+            f'"geometric_accuracy": {score}, "manufacturing_viability": {score}, '
+            f'"reasoning": "Score {score}"}}'
+        )
 
         async def mock_acall(messages, system, tools):
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A cube",
-                    "key_constraints": [],
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 50,
-                    "text_similarity": 60,
-                    "geometric_accuracy": 40,
-                    "manufacturing_viability": 50,
-                    "reasoning": "Needs improvement",
-                }))
+            s = system.lower()
+            if "supervisor" in s:
+                return _mock_llm_response(
+                    '{"golden_spec": "A cube", "key_constraints": [], '
+                    '"critical_dimensions": {"side_length": "50mm", '
+                    '"side_width": "50mm", "side_height": "50mm"}}'
+                )
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(judge_json)
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             return _mock_llm_response("result = cq.Workplane().box(50,50,50)")
 
         config = {
@@ -383,101 +426,23 @@ class TestGraphForcedRevert:
             "debate_enabled": False,
         }
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            mock.call = MagicMock(return_value=_mock_llm_response(json.dumps({
-                "golden_spec": "A cube", "key_constraints": [],
-            })))
-            MockClient.return_value = mock
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=2,
-            ):
-                events.append(event)
-
-        # Should have multiple rounds
-        round_events = [e for e in events if e["event"] == "competitive_round"]
-        assert len(round_events) >= 2
-
-        # Should end in failure
-        status_events = [e for e in events if e["event"] == "competitive_status"]
-        final_status = [e for e in status_events if e["data"].get("status") == "failed"]
-        assert len(final_status) >= 1
-
-
-class TestGraphMerger:
-    @pytest.mark.asyncio
-    async def test_merger_selects_winner(self, tmp_path: Path):
-        """When one proposal passes, it should be selected."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
-        design = CompetitiveDesignSpec(
-            title="Test", prompt="Make a box",
+        events, _ = await _run_graph(
+            graph_client, mock_acall, tmp_path, design, config, max_rounds=max_rounds,
         )
-        store.save(design)
 
-        async def mock_acall(messages, system, tools):
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A cube",
-                    "key_constraints": [],
-                    "critical_dimensions": {"side_length": "50mm", "side_width": "50mm", "side_height": "50mm"},
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 97,
-                    "text_similarity": 95,
-                    "geometric_accuracy": 98,
-                    "manufacturing_viability": 97,
-                    "reasoning": "Excellent",
-                }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
-            return _mock_llm_response("result = cq.Workplane().box(50,50,50)")
-
-        config = {
-            "supervisor": {"model": "test/sup"},
-            "judge": {"model": "test/judge"},
-            "merger": {"model": "test/merger"},
-            "proposal_agents": [{"model": "test/a"}],
-            "fidelity_threshold": 95,
-            "debate_enabled": False,
-        }
+        round_events = [e for e in events if e["event"] == "competitive_round"]
+        assert len(round_events) >= max_rounds
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            mock.call = MagicMock(return_value=_mock_llm_response(json.dumps({
-                "golden_spec": "A cube", "key_constraints": [],
-            })))
-            MockClient.return_value = mock
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                events.append(event)
-
-        # Should complete successfully
-        merger_events = [e for e in events if e["event"] == "competitive_merger"]
-        completed = [e for e in merger_events if e["data"].get("status") == "completed"]
-        assert len(completed) >= 1
+        outcome = [
+            e for e in events
+            if e["event"] == event_name and e["data"].get("status") == final_status
+        ]
+        assert len(outcome) >= 1
 
 
 class TestGraphHumanApproval:
     @pytest.mark.asyncio
-    async def test_graph_interrupt_resume(self, tmp_path: Path):
+    async def test_graph_interrupt_resume(self, tmp_path: Path, graph_client):
         """Graph should pause at human_approval and resume with Command."""
         from langgraph.checkpoint.memory import MemorySaver
         from langgraph.types import Command
@@ -486,24 +451,20 @@ class TestGraphHumanApproval:
         checkpointer = MemorySaver()
 
         async def mock_acall(messages, system, tools):
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A cube",
-                    "key_constraints": [],
-                    "critical_dimensions": {"side_length": "50mm", "side_width": "50mm", "side_height": "50mm"},
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 97,
-                    "text_similarity": 95,
-                    "geometric_accuracy": 98,
-                    "manufacturing_viability": 97,
-                    "reasoning": "Excellent",
-                }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
+            s = system.lower()
+            if "supervisor" in s:
+                return _mock_llm_response(
+                    '{"golden_spec": "A cube", "key_constraints": [], '
+                    '"critical_dimensions": {"side_length": "50mm", '
+                    '"side_width": "50mm", "side_height": "50mm"}}'
+                )
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(
+                    '{"score": 97, "text_similarity": 95, "geometric_accuracy": 98, '
+                    '"manufacturing_viability": 97, "reasoning": "Excellent"}'
+                )
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             return _mock_llm_response("result = cq.Workplane().box(50,50,50)")
 
         config = {
@@ -552,43 +513,36 @@ class TestGraphHumanApproval:
 
         thread_config = {"configurable": {"thread_id": design_id}}
 
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            mock.call = MagicMock(return_value=_mock_llm_response(json.dumps({
-                "golden_spec": "A cube", "key_constraints": [],
-            })))
-            MockClient.return_value = mock
-
-            graph = build_competitive_graph(checkpointer=checkpointer)
-
-            # Run until interrupt
-            events_phase1 = []
-            async for chunk in graph.astream(initial_state, thread_config, stream_mode="updates"):
-                for node_name, output in chunk.items():
-                    if output is None or not isinstance(output, dict):
-                        continue
-                    for ev in output.get("sse_events", []):
-                        events_phase1.append(ev)
-
-            # Graph should have paused — verify the state is saved
-            state = await graph.aget_state(thread_config)
-            assert state is not None
-
-            # Resume with approval
-            events_phase2 = []
-            async for chunk in graph.astream(
-                Command(resume={"approved": True, "feedback": "Looks good"}),
-                thread_config,
-                stream_mode="updates",
-            ):
-                for node_name, output in chunk.items():
-                    if output is None or not isinstance(output, dict):
-                        continue
-                    for ev in output.get("sse_events", []):
-                        events_phase2.append(ev)
+        graph_client.return_value = _FakeClient(mock_acall)
+
+        graph = build_competitive_graph(checkpointer=checkpointer)
+
+        # Run until interrupt
+        events_phase1 = await collect_events(
+            _graph_sse_events(
+                graph.astream(initial_state, thread_config, stream_mode="updates"),
+            ),
+        )
+
+        # Phase 1 stops at the approval gate, before any response
+        assert events_phase1
+        assert all(e["event"] != "competitive_approval_response" for e in events_phase1)
+
+        # Graph should have paused — verify the state is saved
+        state = await graph.aget_state(thread_config)
+        assert state is not None
+
+        # Resume with approval — stop as soon as the response is emitted
+        events_phase2 = await collect_events(
+            _graph_sse_events(
+                graph.astream(
+                    Command(resume={"approved": True, "feedback": "Looks good"}),
+                    thread_config,
+                    stream_mode="updates",
+                ),
+            ),
+            "competitive_approval_response",
+        )
 
         # Phase 2 should have approval response
         approval_events = [e for e in events_phase2 if e["event"] == "competitive_approval_response"]
@@ -609,13 +563,10 @@ class TestHybridScoring:
         from cadforge_engine.agent.llm import LiteLLMSubagentClient
 
         # LLM returns score=80
-        llm_response = _mock_llm_response(json.dumps({
-            "score": 80,
-            "text_similarity": 75,
-            "geometric_accuracy": 85,
-            "manufacturing_viability": 80,
-            "reasoning": "Good but not perfect",
-        }))
+        llm_response = _mock_llm_response(
+            '{"score": 80, "text_similarity": 75, "geometric_accuracy": 85, '
+            '"manufacturing_viability": 80, "reasoning": "Good but not perfect"}'
+        )
 
         mock_client = MagicMock(spec=LiteLLMSubagentClient)
         mock_client.model = "test/judge"
@@ -651,13 +602,10 @@ class TestHybridScoring:
         from cadforge_engine.agent.competitive import _run_fidelity_judge
         from cadforge_engine.agent.llm import LiteLLMSubagentClient
 
-        llm_response = _mock_llm_response(json.dumps({
-            "score": 70,
-            "text_similarity": 65,
-            "geometric_accuracy": 75,
-            "manufacturing_viability": 70,
-            "reasoning": "Acceptable",
-        }))
+        llm_response = _mock_llm_response(
+            '{"score": 70, "text_similarity": 65, "geometric_accuracy": 75, '
+            '"manufacturing_viability": 70, "reasoning": "Acceptable"}'
+        )
 
         mock_client = MagicMock(spec=LiteLLMSubagentClient)
         mock_client.model = "test/judge"
@@ -689,43 +637,37 @@ class TestHybridScoring:
 
 class TestVersionHistory:
     @pytest.mark.asyncio
-    async def test_history_accumulates_across_rounds(self, tmp_path: Path):
+    async def test_history_accumulates_across_rounds(self, tmp_path: Path, graph_client):
         """A 2-round pipeline should produce 2 entries in version_history."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(title="Test", prompt="Make a box")
-        store.save(design)
 
         call_count = 0
 
         async def mock_acall(messages, system, tools):
             nonlocal call_count
             call_count += 1
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A cube",
-                    "key_constraints": [],
-                    "critical_dimensions": {"side_length": "50mm"},
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
+            s = system.lower()
+            if "supervisor" in s:
+                return _mock_llm_response(
+                    '{"golden_spec": "A cube", "key_constraints": [], '
+                    '"critical_dimensions": {"side_length": "50mm"}}'
+                )
+            if "judge" in s or "fidelity" in s:
                 # First round: fail (low LLM score). Second round: pass.
                 if call_count <= 6:
-                    return _mock_llm_response(json.dumps({
-                        "score": 10, "text_similarity": 10,
-                        "geometric_accuracy": 10, "manufacturing_viability": 10,
-                        "reasoning": "Poor",
-                    }))
+                    return _mock_llm_response(
+                        '{"score": 10, "text_similarity": 10, '
+                        '"geometric_accuracy": 10, "manufacturing_viability": 10, '
+                        '"reasoning": "Poor"}'
+                    )
                 else:
-                    return _mock_llm_response(json.dumps({
-                        "score": 99, "text_similarity": 99,
-                        "geometric_accuracy": 99, "manufacturing_viability": 99,
-                        "reasoning": "Excellent",
-                    }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
+                    return _mock_llm_response(
+                        '{"score": 99, "text_similarity": 99, '
+                        '"geometric_accuracy": 99, "manufacturing_viability": 99, '
+                        '"reasoning": "Excellent"}'
+                    )
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             return _mock_llm_response("result = Box(50, 50, 50)")
 
         config = {
@@ -737,19 +679,7 @@ class TestVersionHistory:
             "debate_enabled": False,
         }
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            MockClient.return_value = mock
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=3,
-            ):
-                events.append(event)
+        _, store = await _run_graph(graph_client, mock_acall, tmp_path, design, config, max_rounds=3)
 
         # Design should have version history entries
         loaded = store.get(design.id)
@@ -766,11 +696,8 @@ class TestRefinementMode:
     """Test iterative refinement of competitive designs."""
 
     @pytest.mark.asyncio
-    async def test_refinement_seeds_previous_code(self, tmp_path: Path):
+    async def test_refinement_seeds_previous_code(self, tmp_path: Path, graph_client):
         """When design has final_code, graph state includes previous_code."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(
             title="Original Box",
             prompt="Add a 10mm hole in the center of the top face",
@@ -780,12 +707,12 @@ class TestRefinementMode:
         design.final_code = "result = cq.Workplane().box(50, 50, 50)"
         design.final_stl_path = "/tmp/prev.stl"
         design.status = CompetitiveDesignStatus.DRAFT
-        store.save(design)
 
         captured_supervisor_prompts: list[str] = []
         captured_coder_prompts: list[str] = []
 
         async def mock_acall(messages, system, tools):
+            s = system.lower()
             user_content = ""
             for m in messages:
                 if m.get("role") == "user":
@@ -793,24 +720,23 @@ class TestRefinementMode:
                     if isinstance(c, str):
                         user_content += c
 
-            if "supervisor" in system.lower():
+            if "supervisor" in s:
                 captured_supervisor_prompts.append(user_content)
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A 50mm cube with a 10mm hole on top face",
-                    "key_constraints": ["50mm cube", "10mm hole centered on top"],
-                    "critical_dimensions": {"side_length": "50mm", "hole_diameter": "10mm"},
-                    "manufacturing_notes": "Simple geometry",
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 97, "text_similarity": 95,
-                    "geometric_accuracy": 98, "manufacturing_viability": 97,
-                    "reasoning": "Excellent refinement",
-                }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
+                return _mock_llm_response(
+                    '{"golden_spec": "A 50mm cube with a 10mm hole on top face", '
+                    '"key_constraints": ["50mm cube", "10mm hole centered on top"], '
+                    '"critical_dimensions": {"side_length": "50mm", '
+                    '"hole_diameter": "10mm"}, '
+                    '"manufacturing_notes": "Simple geometry"}'
+                )
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(
+                    '{"score": 97, "text_similarity": 95, "geometric_accuracy": 98, '
+                    '"manufacturing_viability": 97, '
+                    '"reasoning": "Excellent refinement"}'
+                )
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             # Coder
             captured_coder_prompts.append(user_content)
             return _mock_llm_response(
@@ -826,19 +752,7 @@ class TestRefinementMode:
             "debate_enabled": False,
         }
 
-        events = []
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            MockClient.return_value = mock
-
-            async for event in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                events.append(event)
+        await _run_graph(graph_client, mock_acall, tmp_path, design, config)
 
         # Supervisor should receive REFINEMENT MODE prompt with previous code
         assert len(captured_supervisor_prompts) >= 1
@@ -853,20 +767,17 @@ class TestRefinementMode:
         assert "cq.Workplane().box(50, 50, 50)" in coder_prompt
 
     @pytest.mark.asyncio
-    async def test_new_design_has_no_refinement_context(self, tmp_path: Path):
+    async def test_new_design_has_no_refinement_context(self, tmp_path: Path, graph_client):
         """When design has no final_code, is_refinement is False."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(
             title="New Box",
             prompt="Create a 50mm cube",
         )
-        store.save(design)
 
         captured_supervisor_prompts: list[str] = []
 
         async def mock_acall(messages, system, tools):
+            s = system.lower()
             user_content = ""
             for m in messages:
                 if m.get("role") == "user":
@@ -874,24 +785,21 @@ class TestRefinementMode:
                     if isinstance(c, str):
                         user_content += c
 
-            if "supervisor" in system.lower():
+            if "supervisor" in s:
                 captured_supervisor_prompts.append(user_content)
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A 50mm cube",
-                    "key_constraints": ["50mm dimensions"],
-                    "critical_dimensions": {"side_length": "50mm"},
-                    "manufacturing_notes": "Simple",
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 97, "text_similarity": 95,
-                    "geometric_accuracy": 98, "manufacturing_viability": 97,
-                    "reasoning": "Good",
-                }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
+                return _mock_llm_response(
+                    '{"golden_spec": "A 50mm cube", '
+                    '"key_constraints": ["50mm dimensions"], '
+                    '"critical_dimensions": {"side_length": "50mm"}, '
+                    '"manufacturing_notes": "Simple"}'
+                )
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(
+                    '{"score": 97, "text_similarity": 95, "geometric_accuracy": 98, '
+                    '"manufacturing_viability": 97, "reasoning": "Good"}'
+                )
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             return _mock_llm_response("result = cq.Workplane().box(50,50,50)")
 
         config = {
@@ -903,18 +811,7 @@ class TestRefinementMode:
             "debate_enabled": False,
         }
 
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            MockClient.return_value = mock
-
-            async for _ in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                pass
+        await _run_graph(graph_client, mock_acall, tmp_path, design, config)
 
         # Supervisor should NOT receive REFINEMENT MODE prompt
         assert len(captured_supervisor_prompts) >= 1
@@ -924,30 +821,21 @@ class TestRefinementMode:
 
 
     @pytest.mark.asyncio
-    async def test_fidelity_history_accumulates(self, tmp_path: Path):
+    async def test_fidelity_history_accumulates(self, tmp_path: Path, graph_client):
         """Fidelity score history should have entries from pipeline rounds."""
-        from cadforge_engine.agent.competitive_graph import run_competitive_graph
-
-        store = CompetitiveDesignStore(tmp_path)
         design = CompetitiveDesignSpec(title="Test", prompt="Make a box")
-        store.save(design)
 
         async def mock_acall(messages, system, tools):
-            if "supervisor" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "golden_spec": "A cube",
-                    "key_constraints": [],
-                }))
-            if "judge" in system.lower() or "fidelity" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "score": 99, "text_similarity": 99,
-                    "geometric_accuracy": 99, "manufacturing_viability": 99,
-                    "reasoning": "Great",
-                }))
-            if "learner" in system.lower() or "pattern" in system.lower():
-                return _mock_llm_response(json.dumps({
-                    "patterns": [], "anti_patterns": [], "key_insights": [],
-                }))
+            s = system.lower()
+            if "supervisor" in s:
+                return _mock_llm_response('{"golden_spec": "A cube", "key_constraints": []}')
+            if "judge" in s or "fidelity" in s:
+                return _mock_llm_response(
+                    '{"score": 99, "text_similarity": 99, "geometric_accuracy": 99, '
+                    '"manufacturing_viability": 99, "reasoning": "Great"}'
+                )
+            if "learner" in s or "pattern" in s:
+                return _mock_llm_response(_LEARNER_EMPTY_JSON)
             return _mock_llm_response("result = Box(50, 50, 50)")
 
         config = {
@@ -959,18 +847,7 @@ class TestRefinementMode:
             "debate_enabled": False,
         }
 
-        with patch(_GRAPH_PATCHES[0]) as MockClient, \
-             patch(_GRAPH_PATCHES[1], side_effect=_noop_evaluate_proposal):
-            mock = MagicMock()
-            mock.model = "test/model"
-            mock.acall = AsyncMock(side_effect=mock_acall)
-            MockClient.return_value = mock
-
-            async for _ in run_competitive_graph(
-                design=design, store=store, project_root=tmp_path,
-                pipeline_config=config, max_rounds=1,
-            ):
-                pass
+        _, store = await _run_graph(graph_client, mock_acall, tmp_path, design, config)
 
         loaded = store.get(design.id)
         assert loaded is not None
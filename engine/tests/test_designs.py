@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
 
 import pytest
-import pytest_asyncio
 
+from cadforge_engine.agent.pipeline import _build_resume_context, run_design_pipeline_tracked
 from cadforge_engine.models.designs import (
     DesignSpec,
     DesignStatus,
@@ -16,6 +17,9 @@ from cadforge_engine.models.designs import (
     IterationRecord,
 )
 from cadforge_engine.vault.learnings import extract_learnings
+from cadforge_engine.vault.schema import VaultChunk
+
+from .helpers import collect_events
 
 
 # ── DesignSpec model tests ──
@@ -69,8 +73,8 @@ class TestDesignSpec:
             specification="Spec text",
             constraints={"min_wall": 1.0},
         )
-        data = json.loads(spec.model_dump_json())
-        restored = DesignSpec(**data)
+        data = spec.model_dump(mode="json")
+        restored = DesignSpec.model_validate(data)
         assert restored.id == spec.id
         assert restored.title == spec.title
         assert restored.constraints == spec.constraints
@@ -102,6 +106,12 @@ class TestIterationRecord:
 # ── DesignStore persistence tests ──
 
 
+@pytest.fixture(scope="module")
+def store_factory(tmp_path_factory: pytest.TempPathFactory) -> Callable[[], DesignStore]:
+    """Return a factory producing an empty DesignStore in a fresh temp dir."""
+    return lambda: DesignStore(tmp_path_factory.mktemp("designs"))
+
+
 class TestDesignStore:
     """Test file-based design persistence."""
 
@@ -110,31 +120,31 @@ class TestDesignStore:
         spec = DesignSpec(title="Box", prompt="Make a box")
         store.save(spec)
 
-        loaded = store.get(spec.id)
+        loaded = DesignStore(tmp_path).get(spec.id)
         assert loaded is not None
         assert loaded.id == spec.id
         assert loaded.title == "Box"
 
-    def test_get_missing(self, tmp_path: Path) -> None:
-        store = DesignStore(tmp_path)
+    def test_get_missing(self, store_factory: Callable[[], DesignStore]) -> None:
+        store = store_factory()
         assert store.get("nonexistent") is None
 
-    def test_list_all(self, tmp_path: Path) -> None:
-        store = DesignStore(tmp_path)
+    def test_list_all(self, store_factory: Callable[[], DesignStore]) -> None:
+        store = store_factory()
         store.save(DesignSpec(title="A"))
         store.save(DesignSpec(title="B"))
         all_designs = store.list_all()
         assert len(all_designs) == 2
 
-    def test_delete(self, tmp_path: Path) -> None:
-        store = DesignStore(tmp_path)
+    def test_delete(self, store_factory: Callable[[], DesignStore]) -> None:
+        store = store_factory()
         spec = DesignSpec(title="Deletable")
         store.save(spec)
         assert store.delete(spec.id) is True
         assert store.get(spec.id) is None
 
-    def test_delete_missing(self, tmp_path: Path) -> None:
-        store = DesignStore(tmp_path)
+    def test_delete_missing(self, store_factory: Callable[[], DesignStore]) -> None:
+        store = store_factory()
         assert store.delete("nonexistent") is False
 
     def test_persistence_with_iterations(self, tmp_path: Path) -> None:
@@ -152,16 +162,12 @@ class TestDesignStore:
         spec.status = DesignStatus.COMPLETED
         store.save(spec)
 
-        loaded = store.get(spec.id)
+        loaded = DesignStore(tmp_path).get(spec.id)
         assert loaded is not None
-        assert len(loaded.iterations) == 1
-        assert loaded.iterations[0].round_number == 1
-        assert loaded.iterations[0].approved is True
-        assert loaded.iterations[0].png_paths == ["/tmp/front.png", "/tmp/side.png"]
-        assert loaded.status == DesignStatus.COMPLETED
+        assert loaded.model_dump() == spec.model_dump()
 
-    def test_updated_at_changes(self, tmp_path: Path) -> None:
-        store = DesignStore(tmp_path)
+    def test_updated_at_changes(self, store_factory: Callable[[], DesignStore]) -> None:
+        store = store_factory()
         spec = DesignSpec(title="Timestamp test")
         store.save(spec)
         first_updated = spec.updated_at
@@ -177,105 +183,127 @@ class TestDesignStore:
 
         json_path = tmp_path / ".cadforge" / "designs" / f"{spec.id}.json"
         assert json_path.exists()
-        data = json.loads(json_path.read_text())
+        data = json.loads(json_path.read_bytes())
         assert data["title"] == "JSON test"
 
+    def test_get_returns_independent_copies(
+        self, store_factory: Callable[[], DesignStore],
+    ) -> None:
+        store = store_factory()
+        spec = DesignSpec(title="Holes", constraints={"holes": [4.0]})
+        store.save(spec)
+
+        first = store.get(spec.id)
+        assert first is not None
+        first.constraints["holes"].append(6.0)
+
+        second = store.get(spec.id)
+        assert second is not None
+        assert second.constraints["holes"] == [4.0]
+
 
 # ── Learning extraction tests ──
 
 
-class TestLearningExtraction:
-    """Test extract_learnings from completed designs."""
+def _make_completed_design() -> DesignSpec:
+    """Build a design with a failed round then an approved round."""
+    design = DesignSpec(
+        title="Test Bracket",
+        prompt="Create a bracket with mounting holes",
+        specification="L-shaped bracket, 50x30x3mm base, 30x30x3mm upright, 4mm mounting holes",
+        status=DesignStatus.COMPLETED,
+    )
+    # Round 1: failed with error
+    design.iterations.append(IterationRecord(
+        round_number=1,
+        code="result = cq.Workplane('XY').box(50, 30, 3)",
+        errors=["NameError: cq not defined"],
+        verdict="",
+        approved=False,
+    ))
+    # Round 2: failed with judge feedback
+    design.iterations.append(IterationRecord(
+        round_number=2,
+        code="import cadquery as cq\nresult = cq.Workplane('XY').box(50, 30, 3)",
+        stl_path="/tmp/bracket.stl",
+        png_paths=["/tmp/bracket_front.png"],
+        verdict="Missing the upright portion and mounting holes.",
+        approved=False,
+    ))
+    # Round 3: approved
+    design.iterations.append(IterationRecord(
+        round_number=3,
+        code=(
+            "import cadquery as cq\n"
+            "base = cq.Workplane('XY').box(50, 30, 3)\n"
+            "upright = cq.Workplane('XZ').center(0, 15).box(30, 30, 3)\n"
+            "result = base.union(upright)"
+        ),
+        stl_path="/tmp/bracket_v3.stl",
+        png_paths=["/tmp/bracket_v3_front.png", "/tmp/bracket_v3_side.png"],
+        verdict="APPROVED",
+        approved=True,
+    ))
+    return design
 
-    def _make_completed_design(self) -> DesignSpec:
-        """Build a design with a failed round then an approved round."""
-        design = DesignSpec(
-            title="Test Bracket",
-            prompt="Create a bracket with mounting holes",
-            specification="L-shaped bracket, 50x30x3mm base, 30x30x3mm upright, 4mm mounting holes",
-            status=DesignStatus.COMPLETED,
-        )
-        # Round 1: failed with error
-        design.iterations.append(IterationRecord(
-            round_number=1,
-            code="result = cq.Workplane('XY').box(50, 30, 3)",
-            errors=["NameError: cq not defined"],
-            verdict="",
-            approved=False,
-        ))
-        # Round 2: failed with judge feedback
-        design.iterations.append(IterationRecord(
-            round_number=2,
-            code="import cadquery as cq\nresult = cq.Workplane('XY').box(50, 30, 3)",
-            stl_path="/tmp/bracket.stl",
-            png_paths=["/tmp/bracket_front.png"],
-            verdict="Missing the upright portion and mounting holes.",
-            approved=False,
-        ))
-        # Round 3: approved
-        design.iterations.append(IterationRecord(
-            round_number=3,
-            code=(
-                "import cadquery as cq\n"
-                "base = cq.Workplane('XY').box(50, 30, 3)\n"
-                "upright = cq.Workplane('XZ').center(0, 15).box(30, 30, 3)\n"
-                "result = base.union(upright)"
-            ),
-            stl_path="/tmp/bracket_v3.stl",
-            png_paths=["/tmp/bracket_v3_front.png", "/tmp/bracket_v3_side.png"],
-            verdict="APPROVED",
-            approved=True,
-        ))
-        return design
 
-    def test_extracts_successful_pattern(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
+@pytest.fixture(scope="class")
+def completed_design() -> DesignSpec:
+    return _make_completed_design()
 
-        successful = [c for c in chunks if "successful" in c.tags]
-        assert len(successful) == 1
-        assert "cad-pattern" in successful[0].tags
-        assert "learning" in successful[0].tags
-        assert "bracket" in successful[0].content.lower()
 
-    def test_extracts_error_patterns(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
+@pytest.fixture(scope="class")
+def learning_chunks(completed_design: DesignSpec) -> list[VaultChunk]:
+    # extract_learnings is pure, so one run serves the whole class
+    return extract_learnings(completed_design)
 
-        errors = [c for c in chunks if "error-pattern" in c.tags]
-        assert len(errors) == 1  # Only round 1 has errors
-        assert "NameError" in errors[0].content
 
-    def test_extracts_refinement_feedback(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
+@pytest.fixture(scope="class")
+def chunks_by_tag(learning_chunks: list[VaultChunk]) -> dict[str, list[VaultChunk]]:
+    """Index learning chunks by tag in a single pass."""
+    index: dict[str, list[VaultChunk]] = defaultdict(list)
+    for chunk in learning_chunks:
+        for tag in chunk.tags:
+            index[tag].append(chunk)
+    return dict(index)
 
-        refinements = [c for c in chunks if "refinement" in c.tags]
-        assert len(refinements) == 1  # Round 2 has verdict but no approval
-        assert "mounting holes" in refinements[0].content.lower()
 
-    def test_extracts_geometric_pattern(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
+class TestLearningExtraction:
+    """Test extract_learnings from completed designs."""
 
-        geometric = [c for c in chunks if "geometric-pattern" in c.tags]
-        assert len(geometric) == 1
-        assert "bracket" in geometric[0].content.lower()
+    @pytest.mark.parametrize("tag, expected_count, content_substr", [
+        ("successful", 1, "bracket"),
+        ("error-pattern", 1, "NameError"),  # Only round 1 has errors
+        ("refinement", 1, "mounting holes"),  # Round 2 has verdict but no approval
+        ("geometric-pattern", 1, "L-shaped bracket"),
+    ])
+    def test_extracts_tagged_chunk(
+        self,
+        chunks_by_tag: dict[str, list[VaultChunk]],
+        tag: str,
+        expected_count: int,
+        content_substr: str,
+    ) -> None:
+        matched = chunks_by_tag.get(tag, [])
+        assert len(matched) == expected_count
+        assert content_substr in matched[0].content
+
+    def test_successful_pattern_tags(self, chunks_by_tag: dict[str, list[VaultChunk]]) -> None:
+        successful = chunks_by_tag["successful"]
+        assert "cad-pattern" in successful[0].tags
+        assert "learning" in successful[0].tags
 
-    def test_total_chunk_count(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
+    def test_total_chunk_count(self, learning_chunks: list[VaultChunk]) -> None:
         # 1 successful + 1 error + 1 refinement + 1 geometric = 4
-        assert len(chunks) == 4
+        assert len(learning_chunks) == 4
 
-    def test_chunk_metadata(self) -> None:
-        design = self._make_completed_design()
-        chunks = extract_learnings(design)
-
-        for chunk in chunks:
-            assert chunk.metadata.get("design_id") == design.id
+    def test_chunk_metadata(
+        self, completed_design: DesignSpec, learning_chunks: list[VaultChunk],
+    ) -> None:
+        for chunk in learning_chunks:
+            assert chunk.metadata.get("design_id") == completed_design.id
             assert chunk.metadata.get("learning_type") is not None
-            assert chunk.file_path == f"learnings/design-{design.id}.md"
+            assert chunk.file_path == f"learnings/design-{completed_design.id}.md"
 
     def test_empty_design_no_learnings(self) -> None:
         design = DesignSpec(title="Empty", prompt="Nothing")
@@ -307,11 +335,18 @@ class TestLearningExtraction:
 # ── Tracked pipeline tests (mock LLM) ──
 
 
+_DEFAULT_RESPONSE: dict[str, Any] = {
+    "content": [{"type": "text", "text": "APPROVED"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 0, "output_tokens": 0},
+}
+
+
 class MockLLMClient:
     """Mock LLM client for tracked pipeline tests."""
 
-    def __init__(self, responses: list[dict[str, Any]]) -> None:
-        self._responses = list(responses)
+    def __init__(self, responses: Sequence[dict[str, Any]]) -> None:
+        self._responses = tuple(responses)
         self._call_index = 0
         self.model = "mock-model"
         self.max_tokens = 8192
@@ -323,11 +358,7 @@ class MockLLMClient:
         tools: list[dict[str, Any]],
     ) -> dict[str, Any]:
         if self._call_index >= len(self._responses):
-            return {
-                "content": [{"type": "text", "text": "APPROVED"}],
-                "stop_reason": "end_turn",
-                "usage": {"input_tokens": 0, "output_tokens": 0},
-            }
+            return _DEFAULT_RESPONSE
         resp = self._responses[self._call_index]
         self._call_index += 1
         return resp
@@ -341,6 +372,9 @@ def _text_response(text: str) -> dict[str, Any]:
     }
 
 
+_APPROVED_TEXT_RESPONSE = _text_response("APPROVED")
+
+
 def _tool_use_response(code: str) -> dict[str, Any]:
     return {
         "content": [
@@ -361,11 +395,19 @@ def _tool_use_response(code: str) -> dict[str, Any]:
     }
 
 
+_TRACKED_BOX_RESPONSES = (
+    # Coder: tool use
+    _tool_use_response("import cadquery as cq\nresult = cq.Workplane('XY').box(20, 15, 10)"),
+    # Coder follow-up: done
+    _text_response("Model created."),
+    # Judge: APPROVED
+    _APPROVED_TEXT_RESPONSE,
+)
+
+
 @pytest.mark.asyncio
 async def test_tracked_pipeline_persists_iterations(tmp_path: Path) -> None:
     """Test that tracked pipeline persists IterationRecords to the DesignStore."""
-    from cadforge_engine.agent.pipeline import run_design_pipeline_tracked
-
     store = DesignStore(tmp_path)
     design = DesignSpec(
         title="Tracked Box",
@@ -375,33 +417,25 @@ async def test_tracked_pipeline_persists_iterations(tmp_path: Path) -> None:
     )
     store.save(design)
 
-    mock_client = MockLLMClient([
-        # Coder: tool use
-        _tool_use_response("import cadquery as cq\nresult = cq.Workplane('XY').box(20, 15, 10)"),
-        # Coder follow-up: done
-        _text_response("Model created."),
-        # Judge: APPROVED
-        _text_response("APPROVED"),
-    ])
-
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline_tracked(
-        llm_client=mock_client,
-        design=design,
-        design_store=store,
-        project_root=tmp_path,
-        max_rounds=3,
-    ):
-        events.append(event)
-
-    event_types = [e["event"] for e in events]
-    assert "iteration_saved" in event_types
-    assert "design_updated" in event_types
-    assert "completion" in event_types
-    assert "done" in event_types
+    mock_client = MockLLMClient(_TRACKED_BOX_RESPONSES)
+
+    target = {"iteration_saved", "design_updated", "completion", "done"}
+    events = await collect_events(
+        run_design_pipeline_tracked(
+            llm_client=mock_client,
+            design=design,
+            design_store=store,
+            project_root=tmp_path,
+            # The judge approves round 1, so a single round covers every
+            # event asserted below; extra rounds would never execute.
+            max_rounds=1,
+        ),
+        target,
+    )
+    assert target <= {e["event"] for e in events}
 
     # Reload from disk and check
-    reloaded = store.get(design.id)
+    reloaded = DesignStore(tmp_path).get(design.id)
     assert reloaded is not None
     assert len(reloaded.iterations) >= 1
     assert reloaded.status in (DesignStatus.COMPLETED, DesignStatus.FAILED)
@@ -410,33 +444,28 @@ async def test_tracked_pipeline_persists_iterations(tmp_path: Path) -> None:
 @pytest.mark.asyncio
 async def test_tracked_pipeline_empty_spec(tmp_path: Path) -> None:
     """Test that tracked pipeline handles empty spec gracefully."""
-    from cadforge_engine.agent.pipeline import run_design_pipeline_tracked
-
     store = DesignStore(tmp_path)
     design = DesignSpec(title="Empty", specification="")
     store.save(design)
 
-    mock_client = MockLLMClient([])
-
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline_tracked(
-        llm_client=mock_client,
-        design=design,
-        design_store=store,
-        project_root=tmp_path,
-    ):
-        events.append(event)
-
-    event_types = [e["event"] for e in events]
-    assert "completion" in event_types
-    assert "done" in event_types
+    mock_client = MockLLMClient(())
+
+    target = {"completion", "done"}
+    events = await collect_events(
+        run_design_pipeline_tracked(
+            llm_client=mock_client,
+            design=design,
+            design_store=store,
+            project_root=tmp_path,
+        ),
+        target,
+    )
+    assert target <= {e["event"] for e in events}
 
 
 @pytest.mark.asyncio
 async def test_tracked_pipeline_resume_context(tmp_path: Path) -> None:
     """Test that resume builds context from previous iterations."""
-    from cadforge_engine.agent.pipeline import _build_resume_context
-
     design = DesignSpec(title="Resume test", specification="A box")
     design.iterations.append(IterationRecord(
         round_number=1,
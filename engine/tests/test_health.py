@@ -2,16 +2,9 @@
 
 from __future__ import annotations
 
-import pytest
 from fastapi.testclient import TestClient
 
-from cadforge_engine.app import create_app
-
-
-@pytest.fixture
-def client() -> TestClient:
-    app = create_app()
-    return TestClient(app)
+from cadforge_engine import __version__ as ENGINE_VERSION
 
 
 def test_health_returns_ok(client: TestClient) -> None:
@@ -24,6 +17,5 @@ def test_health_returns_ok(client: TestClient) -> None:
 
 
 def test_health_version_matches(client: TestClient) -> None:
-    from cadforge_engine import __version__
     response = client.get("/health")
-    assert response.json()["version"] == __version__
+    assert response.json()["version"] == ENGINE_VERSION
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import json
+import sys
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,6 +15,10 @@ from cadforge_engine.agent.llm import (
 )
 
 
+# Token usage is read-only in every test, so one instance is shared.
+_USAGE = SimpleNamespace(prompt_tokens=10, completion_tokens=20)
+
+
 def _make_openai_response(content: str = "Hello", tool_calls=None, finish_reason="stop"):
     """Create a mock OpenAI-format completion response."""
     message = SimpleNamespace(
@@ -25,11 +29,13 @@ def _make_openai_response(content: str = "Hello", tool_calls=None, finish_reason
         message=message,
         finish_reason=finish_reason,
     )
-    usage = SimpleNamespace(
-        prompt_tokens=10,
-        completion_tokens=20,
-    )
-    return SimpleNamespace(choices=[choice], usage=usage)
+    return SimpleNamespace(choices=[choice], usage=_USAGE)
+
+
+_DEFAULT_OPENAI_RESPONSE = _make_openai_response()
+
+
+_DEFAULT_TOOL_ARGS_JSON = json.dumps({"code": "result = 1"})
 
 
 def _make_tool_call(name: str = "ExecuteCadQuery", args: dict | None = None):
@@ -39,11 +45,52 @@ def _make_tool_call(name: str = "ExecuteCadQuery", args: dict | None = None):
         type="function",
         function=SimpleNamespace(
             name=name,
-            arguments=json.dumps(args or {"code": "result = 1"}),
+            arguments=_DEFAULT_TOOL_ARGS_JSON if args is None else json.dumps(args),
         ),
     )
 
 
+class _FakeLiteLLM:
+    """Minimal stand-in for the ``litellm`` module.
+
+    Records the kwargs of the most recent call and how many times
+    ``acompletion`` was awaited; ``response`` is returned by both entry points.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.response = _DEFAULT_OPENAI_RESPONSE
+        self.last_call: dict | None = None
+        self.await_count = 0
+
+    def completion(self, **kwargs):
+        self.last_call = kwargs
+        return self.response
+
+    async def acompletion(self, **kwargs):
+        self.last_call = kwargs
+        self.await_count += 1
+        return self.response
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fake_litellm():
+    """Install a single stub ``litellm`` module for every test in this file."""
+    fake = _FakeLiteLLM()
+    mp = pytest.MonkeyPatch()
+    mp.setitem(sys.modules, "litellm", fake)
+    yield fake
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_litellm(fake_litellm):
+    yield
+    fake_litellm.reset()
+
+
 class TestLiteLLMSubagentClient:
     def test_init_defaults(self):
         client = LiteLLMSubagentClient()
@@ -61,17 +108,15 @@ class TestLiteLLMSubagentClient:
         assert client.max_tokens == 4096
         assert client._api_key == "test-key"
 
-    def test_sync_call(self):
-        mock_litellm = MagicMock()
-        mock_litellm.completion.return_value = _make_openai_response("Test output")
+    def test_sync_call(self, fake_litellm):
+        fake_litellm.response = _make_openai_response("Test output")
 
-        with patch.dict("sys.modules", {"litellm": mock_litellm}):
-            client = LiteLLMSubagentClient(model="test/model")
-            result = client.call(
-                messages=[{"role": "user", "content": "Hello"}],
-                system="You are a test",
-                tools=[],
-            )
+        client = LiteLLMSubagentClient(model="test/model")
+        result = client.call(
+            messages=[{"role": "user", "content": "Hello"}],
+            system="You are a test",
+            tools=[],
+        )
 
         assert result["content"][0]["type"] == "text"
         assert result["content"][0]["text"] == "Test output"
@@ -80,30 +125,28 @@ class TestLiteLLMSubagentClient:
         assert result["usage"]["output_tokens"] == 20
 
         # Verify litellm.completion was called with correct args
-        call_kwargs = mock_litellm.completion.call_args[1]
+        call_kwargs = fake_litellm.last_call
         assert call_kwargs["model"] == "test/model"
         assert call_kwargs["max_tokens"] == 8192
         assert len(call_kwargs["messages"]) == 2  # system + user
 
-    def test_sync_call_with_tools(self):
+    def test_sync_call_with_tools(self, fake_litellm):
         tc = _make_tool_call("ExecuteCadQuery", {"code": "result = 1"})
-        mock_litellm = MagicMock()
-        mock_litellm.completion.return_value = _make_openai_response(
+        fake_litellm.response = _make_openai_response(
             content=None, tool_calls=[tc], finish_reason="tool_calls",
         )
 
-        with patch.dict("sys.modules", {"litellm": mock_litellm}):
-            client = LiteLLMSubagentClient(model="test/model")
-            tools = [{
-                "name": "ExecuteCadQuery",
-                "description": "Execute code",
-                "input_schema": {"type": "object", "properties": {"code": {"type": "string"}}},
-            }]
-            result = client.call(
-                messages=[{"role": "user", "content": "Generate code"}],
-                system="You are a coder",
-                tools=tools,
-            )
+        client = LiteLLMSubagentClient(model="test/model")
+        tools = [{
+            "name": "ExecuteCadQuery",
+            "description": "Execute code",
+            "input_schema": {"type": "object", "properties": {"code": {"type": "string"}}},
+        }]
+        result = client.call(
+            messages=[{"role": "user", "content": "Generate code"}],
+            system="You are a coder",
+            tools=tools,
+        )
 
         # Should have a tool_use block
         tool_blocks = [b for b in result["content"] if b["type"] == "tool_use"]
@@ -112,50 +155,36 @@ class TestLiteLLMSubagentClient:
         assert tool_blocks[0]["input"] == {"code": "result = 1"}
 
         # Verify tools were translated
-        call_kwargs = mock_litellm.completion.call_args[1]
+        call_kwargs = fake_litellm.last_call
         assert call_kwargs["tools"] is not None
 
-    def test_sync_call_with_api_key(self):
-        mock_litellm = MagicMock()
-        mock_litellm.completion.return_value = _make_openai_response()
-
-        with patch.dict("sys.modules", {"litellm": mock_litellm}):
-            client = LiteLLMSubagentClient(model="test/model", api_key="my-secret")
-            client.call(messages=[], system="test", tools=[])
+    def test_sync_call_with_api_key(self, fake_litellm):
+        client = LiteLLMSubagentClient(model="test/model", api_key="my-secret")
+        client.call(messages=[], system="test", tools=[])
 
-        call_kwargs = mock_litellm.completion.call_args[1]
+        call_kwargs = fake_litellm.last_call
         assert call_kwargs["api_key"] == "my-secret"
 
     @pytest.mark.asyncio
-    async def test_async_call(self):
-        mock_litellm = MagicMock()
-        mock_litellm.acompletion = AsyncMock(
-            return_value=_make_openai_response("Async output")
+    async def test_async_call(self, fake_litellm):
+        fake_litellm.response = _make_openai_response("Async output")
+
+        client = LiteLLMSubagentClient(model="test/model")
+        result = await client.acall(
+            messages=[{"role": "user", "content": "Hello"}],
+            system="You are a test",
+            tools=[],
         )
 
-        with patch.dict("sys.modules", {"litellm": mock_litellm}):
-            client = LiteLLMSubagentClient(model="test/model")
-            result = await client.acall(
-                messages=[{"role": "user", "content": "Hello"}],
-                system="You are a test",
-                tools=[],
-            )
-
         assert result["content"][0]["text"] == "Async output"
-        mock_litellm.acompletion.assert_awaited_once()
+        assert fake_litellm.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_async_call_with_api_key(self):
-        mock_litellm = MagicMock()
-        mock_litellm.acompletion = AsyncMock(
-            return_value=_make_openai_response()
-        )
-
-        with patch.dict("sys.modules", {"litellm": mock_litellm}):
-            client = LiteLLMSubagentClient(model="test/model", api_key="async-key")
-            await client.acall(messages=[], system="test", tools=[])
+    async def test_async_call_with_api_key(self, fake_litellm):
+        client = LiteLLMSubagentClient(model="test/model", api_key="async-key")
+        await client.acall(messages=[], system="test", tools=[])
 
-        call_kwargs = mock_litellm.acompletion.call_args[1]
+        call_kwargs = fake_litellm.last_call
         assert call_kwargs["api_key"] == "async-key"
 
 
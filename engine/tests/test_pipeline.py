@@ -5,22 +5,23 @@ Uses mocked LLM calls to verify the 3-round loop logic.
 
 from __future__ import annotations
 
-import json
+from collections import defaultdict
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Any, Sequence
 
 import pytest
-import pytest_asyncio
 
 from cadforge_engine.agent.pipeline import run_design_pipeline
 
+from .helpers import collect_events
+
 
 class MockLLMClient:
     """Mock LLM client that returns predetermined responses."""
 
-    def __init__(self, responses: list[dict[str, Any]]) -> None:
-        self._responses = list(responses)
+    def __init__(self, responses: Sequence[dict[str, Any]]) -> None:
+        self._responses = responses
         self._call_index = 0
         self.model = "mock-model"
         self.max_tokens = 8192
@@ -32,24 +33,27 @@ class MockLLMClient:
         tools: list[dict[str, Any]],
     ) -> dict[str, Any]:
         if self._call_index >= len(self._responses):
-            return {
-                "content": [{"type": "text", "text": "APPROVED"}],
-                "stop_reason": "end_turn",
-                "usage": {"input_tokens": 0, "output_tokens": 0},
-            }
+            return _APPROVED
         resp = self._responses[self._call_index]
         self._call_index += 1
         return resp
 
 
+# Token usage is only ever read, so every mock response shares one frozen copy.
+_USAGE = MappingProxyType({"input_tokens": 100, "output_tokens": 50})
+
+
 def _text_response(text: str) -> dict[str, Any]:
     return {
         "content": [{"type": "text", "text": text}],
         "stop_reason": "end_turn",
-        "usage": {"input_tokens": 100, "output_tokens": 50},
+        "usage": _USAGE,
     }
 
 
+_APPROVED = _text_response("APPROVED")
+
+
 def _tool_use_response(code: str, output_name: str = "pipeline_model") -> dict[str, Any]:
     return {
         "content": [
@@ -66,44 +70,51 @@ def _tool_use_response(code: str, output_name: str = "pipeline_model") -> dict[s
             },
         ],
         "stop_reason": "tool_use",
-        "usage": {"input_tokens": 100, "output_tokens": 50},
+        "usage": _USAGE,
     }
 
 
+# Designer → coder (tool use) → coder follow-up → judge (approved)
+_BASIC_RESPONSES = (
+    _text_response("Box: 20x15x10mm centered at origin"),
+    _tool_use_response(
+        "import cadquery as cq\nresult = cq.Workplane('XY').box(20, 15, 10)"
+    ),
+    _text_response("Model created successfully."),
+    _APPROVED,
+)
+
+
+def _index(events: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Group events by type in a single pass."""
+    idx: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for event in events:
+        idx[event["event"]].append(event)
+    return idx
+
+
 @pytest.mark.asyncio
 async def test_pipeline_basic_flow(tmp_path: Path) -> None:
     """Test basic pipeline flow: designer → coder → renderer → judge (approved)."""
-    mock_client = MockLLMClient([
-        # 1. Designer response
-        _text_response("Box: 20x15x10mm centered at origin"),
-        # 2. Coder response (tool use)
-        _tool_use_response(
-            "import cadquery as cq\nresult = cq.Workplane('XY').box(20, 15, 10)"
-        ),
-        # 3. Coder follow-up (after tool result, no more tools)
-        _text_response("Model created successfully."),
-        # 4. Judge response (approved)
-        _text_response("APPROVED"),
-    ])
-
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline(
+    mock_client = MockLLMClient(_BASIC_RESPONSES)
+
+    events = await collect_events(run_design_pipeline(
         llm_client=mock_client,
         prompt="Make a box 20x15x10mm",
         project_root=str(tmp_path),
         max_rounds=3,
-    ):
-        events.append(event)
+    ), "done")
 
-    event_types = [e["event"] for e in events]
-    assert "pipeline_step" in event_types
-    assert "pipeline_round" in event_types
-    assert "tool_use_start" in event_types
-    assert "tool_result" in event_types
-    assert "completion" in event_types
-    assert "done" in event_types
+    idx = _index(events)
+    assert "pipeline_step" in idx
+    assert "pipeline_round" in idx
+    assert "tool_use_start" in idx
+    assert "tool_result" in idx
+    assert "completion" in idx
+    assert "done" in idx
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_pipeline_revision_round(tmp_path: Path) -> None:
     """Test that judge feedback triggers a second coder round.
@@ -131,7 +142,7 @@ async def test_pipeline_revision_round(tmp_path: Path) -> None:
                 if call_count <= 5:
                     return _text_response("Needs revision: make it 20x20x20 instead.")
                 # Second judge call -> approve
-                return _text_response("APPROVED")
+                return _APPROVED
 
             # Coder — check if tools available
             if tools:
@@ -140,45 +151,38 @@ async def test_pipeline_revision_round(tmp_path: Path) -> None:
                 )
             return _text_response("Model created.")
 
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline(
+    events = await collect_events(run_design_pipeline(
         llm_client=RevisionMockClient(),
         prompt="Make a box",
         project_root=str(tmp_path),
         max_rounds=3,
-    ):
-        events.append(event)
+    ), "done")
 
-    event_types = [e["event"] for e in events]
+    idx = _index(events)
 
     # Should see multiple rounds
-    round_events = [e for e in events if e["event"] == "pipeline_round"]
-    assert len(round_events) >= 2
+    assert len(idx["pipeline_round"]) >= 2
 
     # Should have pipeline steps
-    assert "pipeline_step" in event_types
-    assert "completion" in event_types
-    assert "done" in event_types
+    assert "pipeline_step" in idx
+    assert "completion" in idx
+    assert "done" in idx
 
 
 @pytest.mark.asyncio
 async def test_pipeline_empty_spec(tmp_path: Path) -> None:
     """Test that empty designer spec ends pipeline gracefully."""
-    mock_client = MockLLMClient([
-        _text_response(""),
-    ])
+    mock_client = MockLLMClient((_text_response(""),))
 
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline(
+    events = await collect_events(run_design_pipeline(
         llm_client=mock_client,
         prompt="???",
         project_root=str(tmp_path),
-    ):
-        events.append(event)
+    ), "done")
 
-    event_types = [e["event"] for e in events]
-    assert "completion" in event_types
-    assert "done" in event_types
+    idx = _index(events)
+    assert "completion" in idx
+    assert "done" in idx
 
 
 @pytest.mark.asyncio
@@ -191,17 +195,14 @@ async def test_pipeline_designer_error(tmp_path: Path) -> None:
         def call(self, **kwargs):
             raise RuntimeError("API down")
 
-    events: list[dict[str, Any]] = []
-    async for event in run_design_pipeline(
+    events = await collect_events(run_design_pipeline(
         llm_client=ErrorClient(),
         prompt="Make something",
         project_root=str(tmp_path),
-    ):
-        events.append(event)
+    ), "done")
 
-    event_types = [e["event"] for e in events]
-    assert "completion" in event_types
-    assert "done" in event_types
+    idx = _index(events)
+    assert "completion" in idx
+    assert "done" in idx
     # Should mention error
-    completion = next(e for e in events if e["event"] == "completion")
-    assert "error" in completion["data"]["text"].lower()
+    assert "error" in idx["completion"][0]["data"]["text"].lower()
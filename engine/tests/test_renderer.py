@@ -5,60 +5,60 @@ Tests are skipped if pyvista is not available.
 
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
 
 import pytest
 
-pyvista = pytest.importorskip("pyvista")
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("pyvista") is None, reason="pyvista not installed",
+)
 
 
-def _create_test_stl(tmp_path: Path) -> Path:
-    """Create a simple STL file using pyvista for testing."""
+@pytest.fixture(scope="session")
+def box_stl(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a simple STL once per session; renderer tests only read it."""
     import pyvista as pv
 
-    box = pv.Box()
-    stl_path = tmp_path / "test_box.stl"
-    box.save(str(stl_path))
+    stl_path = tmp_path_factory.mktemp("stl") / "test_box.stl"
+    pv.Box().save(str(stl_path))
     return stl_path
 
 
 class TestRenderer:
     """Test headless renderer."""
 
-    def test_render_produces_pngs(self, tmp_path: Path) -> None:
+    def test_render_produces_pngs(self, box_stl: Path, tmp_path: Path) -> None:
         from cadforge_engine.domain.renderer import render_stl_to_png
 
-        stl_path = _create_test_stl(tmp_path)
         png_base = tmp_path / "output" / "test_box"
 
-        paths = render_stl_to_png(stl_path, png_base)
+        paths = render_stl_to_png(box_stl, png_base)
 
         assert len(paths) == 3
         for p in paths:
             assert p.exists(), f"PNG not created: {p}"
             assert p.stat().st_size > 0, f"PNG is empty: {p}"
 
-    def test_render_view_names(self, tmp_path: Path) -> None:
+    def test_render_view_names(self, box_stl: Path, tmp_path: Path) -> None:
         from cadforge_engine.domain.renderer import render_stl_to_png
 
-        stl_path = _create_test_stl(tmp_path)
         png_base = tmp_path / "test_box"
 
-        paths = render_stl_to_png(stl_path, png_base)
+        paths = render_stl_to_png(box_stl, png_base)
 
         names = [p.stem for p in paths]
         assert "test_box_isometric" in names
         assert "test_box_front" in names
         assert "test_box_right" in names
 
-    def test_custom_camera_angles(self, tmp_path: Path) -> None:
+    def test_custom_camera_angles(self, box_stl: Path, tmp_path: Path) -> None:
         from cadforge_engine.domain.renderer import render_stl_to_png
 
-        stl_path = _create_test_stl(tmp_path)
         png_base = tmp_path / "test_box"
 
         paths = render_stl_to_png(
-            stl_path,
+            box_stl,
             png_base,
             camera_angles=[(0, 90, 0)],
         )
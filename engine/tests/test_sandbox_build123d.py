@@ -6,81 +6,80 @@ Tests are skipped if build123d is not installed.
 
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from cadforge_engine.domain.sandbox import build_namespace, execute_cadquery
+
 # Skip entire module if build123d is not available
-build123d = pytest.importorskip("build123d")
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("build123d") is None, reason="build123d not installed",
+)
 
-from cadforge_engine.domain.sandbox import build_namespace, execute_cadquery
+
+@pytest.fixture(scope="session")
+def bd_namespace() -> dict[str, Any]:
+    """One sandbox namespace shared by the read-only namespace tests."""
+    return build_namespace()
 
 
 class TestBuild123dNamespace:
     """Test that build123d is available in the sandbox namespace."""
 
-    def test_bd_in_namespace(self) -> None:
-        ns = build_namespace()
-        assert "bd" in ns
-        assert "build123d" in ns
+    def test_bd_in_namespace(self, bd_namespace: dict[str, Any]) -> None:
+        assert "bd" in bd_namespace
+        assert "build123d" in bd_namespace
 
-    def test_top_level_names(self) -> None:
-        ns = build_namespace()
+    def test_top_level_names(self, bd_namespace: dict[str, Any]) -> None:
         for name in ("Box", "Cylinder", "Sphere", "BuildPart", "BuildSketch",
                       "extrude", "Mode", "Align", "export_stl", "export_step"):
-            assert name in ns, f"{name} not found in sandbox namespace"
+            assert name in bd_namespace, f"{name} not found in sandbox namespace"
 
-    def test_cq_also_present(self) -> None:
+    def test_cq_also_present(self, bd_namespace: dict[str, Any]) -> None:
         """CadQuery should still be in namespace if installed."""
-        ns = build_namespace()
         # We don't assert cq is present because it may not be installed,
         # but we verify bd didn't break anything
-        assert "math" in ns
-        assert "bd" in ns
+        assert "math" in bd_namespace
+        assert "bd" in bd_namespace
 
 
-class TestBuild123dExecution:
-    """Test executing build123d code in the sandbox."""
-
-    def test_simple_box(self) -> None:
-        code = """\
+_EXECUTION_CASES = {
+    "simple_box": """\
 with BuildPart() as part:
     Box(10, 20, 5)
 result = part.part
-"""
-        result = execute_cadquery(code)
-        assert result.success, f"Execution failed: {result.error}"
-        assert result.result is not None
-
-    def test_cylinder_with_hole(self) -> None:
-        code = """\
+""",
+    "cylinder_with_hole": """\
 with BuildPart() as part:
     Cylinder(radius=10, height=20)
     Cylinder(radius=5, height=20, mode=Mode.SUBTRACT)
 result = part.part
-"""
-        result = execute_cadquery(code)
-        assert result.success, f"Execution failed: {result.error}"
-        assert result.result is not None
-
-    def test_using_bd_namespace(self) -> None:
-        code = """\
+""",
+    "bd_namespace": """\
 with bd.BuildPart() as part:
     bd.Box(15, 15, 10)
 result = part.part
-"""
-        result = execute_cadquery(code)
-        assert result.success, f"Execution failed: {result.error}"
-        assert result.result is not None
-
-    def test_sketch_and_extrude(self) -> None:
-        code = """\
+""",
+    "sketch_and_extrude": """\
 with BuildPart() as part:
     with BuildSketch() as sk:
         Rectangle(20, 10)
     extrude(amount=5)
 result = part.part
-"""
+""",
+}
+
+
+class TestBuild123dExecution:
+    """Test executing build123d code in the sandbox."""
+
+    @pytest.mark.parametrize(
+        "code", list(_EXECUTION_CASES.values()), ids=list(_EXECUTION_CASES),
+    )
+    def test_execute(self, code: str) -> None:
         result = execute_cadquery(code)
         assert result.success, f"Execution failed: {result.error}"
         assert result.result is not None
@@ -5,14 +5,17 @@ Tests use mocked HTTP responses to verify chunk extraction.
 
 from __future__ import annotations
 
-from unittest.mock import patch, MagicMock
+import importlib.util
 
 import pytest
 
-httpx = pytest.importorskip("httpx")
-pytest.importorskip("bs4")
-
 from cadforge_engine.vault.scraper import scrape_url, scrape_documentation
+from cadforge_engine.vault.schema import VaultChunk
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("httpx") is None or importlib.util.find_spec("bs4") is None,
+    reason="httpx and beautifulsoup4 are required",
+)
 
 
 SAMPLE_HTML = """\
@@ -35,54 +38,84 @@ SAMPLE_HTML = """\
 </body>
 </html>
 """
+SAMPLE_HTML_BYTES = SAMPLE_HTML.encode("utf-8")
+
+
+class _Resp:
+    """Minimal stand-in for ``httpx.Response``; only what scrape_url reads."""
+
+    __slots__ = ("text", "content", "charset_encoding", "status_code")
+
+    def __init__(self) -> None:
+        self.text = SAMPLE_HTML
+        self.content = SAMPLE_HTML_BYTES
+        self.charset_encoding = "utf-8"
+        self.status_code = 200
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+# Responses are never mutated, so every mocked fetch returns the same one.
+_RESP = _Resp()
 
 
-def _mock_get(url: str, **kwargs) -> MagicMock:
-    """Create a mock httpx response."""
-    resp = MagicMock()
-    resp.text = SAMPLE_HTML
-    resp.status_code = 200
-    resp.raise_for_status = MagicMock()
-    return resp
+def _mock_get(url: str, **kwargs) -> _Resp:
+    """Return the shared mock httpx response."""
+    return _RESP
+
+
+@pytest.fixture
+def fake_httpx(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Route ``httpx.get`` to the shared response; ``[0]`` counts the calls."""
+    calls = [0]
+
+    def _get(url: str, **kwargs) -> _Resp:
+        calls[0] += 1
+        return _RESP
+
+    monkeypatch.setattr("httpx.get", _get)
+    return calls
+
+
+@pytest.fixture(scope="module")
+def sample_chunks() -> list[VaultChunk]:
+    """Scrape SAMPLE_HTML once; the read-only tests below share the chunks."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("httpx.get", _mock_get)
+        return scrape_url("https://example.com/docs", source_name="test-docs")
 
 
 class TestScrapeUrl:
     """Test single URL scraping."""
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_extracts_chunks(self, mock_get: MagicMock) -> None:
-        chunks = scrape_url("https://example.com/docs", source_name="test-docs")
-        assert len(chunks) > 0
+    def test_extracts_chunks(self, sample_chunks: list[VaultChunk]) -> None:
+        assert len(sample_chunks) > 0
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_chunk_sections(self, mock_get: MagicMock) -> None:
-        chunks = scrape_url("https://example.com/docs", source_name="test-docs")
-        sections = [c.section for c in chunks]
+    def test_chunk_sections(self, sample_chunks: list[VaultChunk]) -> None:
+        sections = [c.section for c in sample_chunks]
         assert "Installation" in sections
         assert "Quick Start" in sections
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_chunk_has_tags(self, mock_get: MagicMock) -> None:
-        chunks = scrape_url("https://example.com/docs", source_name="test-docs")
-        for chunk in chunks:
+    def test_chunk_has_tags(self, sample_chunks: list[VaultChunk]) -> None:
+        for chunk in sample_chunks:
             assert "test-docs" in chunk.tags
             assert "scraped" in chunk.tags
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_chunk_has_source_url(self, mock_get: MagicMock) -> None:
-        chunks = scrape_url("https://example.com/docs", source_name="test-docs")
-        for chunk in chunks:
+    def test_chunk_has_source_url(self, sample_chunks: list[VaultChunk]) -> None:
+        for chunk in sample_chunks:
             assert chunk.metadata["source_url"] == "https://example.com/docs"
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_nav_footer_stripped(self, mock_get: MagicMock) -> None:
-        chunks = scrape_url("https://example.com/docs", source_name="test-docs")
-        all_content = " ".join(c.content for c in chunks)
+    def test_nav_footer_stripped(self, sample_chunks: list[VaultChunk]) -> None:
+        all_content = " ".join(c.content for c in sample_chunks)
         assert "Home" not in all_content  # nav stripped
         assert "Copyright" not in all_content  # footer stripped
 
-    @patch("httpx.get", side_effect=Exception("Network error"))
-    def test_handles_fetch_error(self, mock_get: MagicMock) -> None:
+    def test_handles_fetch_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def _fail(url: str, **kwargs) -> _Resp:
+            raise Exception("Network error")
+
+        monkeypatch.setattr("httpx.get", _fail)
         chunks = scrape_url("https://example.com/broken", source_name="test")
         assert chunks == []
 
@@ -90,12 +123,11 @@ class TestScrapeUrl:
 class TestScrapeDocumentation:
     """Test batch scraping."""
 
-    @patch("httpx.get", side_effect=_mock_get)
-    def test_batch_scrape(self, mock_get: MagicMock) -> None:
+    def test_batch_scrape(self, fake_httpx: list[int]) -> None:
         chunks = scrape_documentation(
             ["https://example.com/page1", "https://example.com/page2"],
             source_name="docs",
         )
         # Should have chunks from both pages
         assert len(chunks) > 0
-        assert mock_get.call_count == 2
+        assert fake_httpx[0] == 2
@@ -6,18 +6,18 @@ without requiring actual Anthropic API credentials.
 
 from __future__ import annotations
 
+import json
+import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import pytest
 from fastapi.testclient import TestClient
 
-from cadforge_engine.app import create_app
 
-
-@pytest.fixture
-def client() -> TestClient:
-    app = create_app()
-    return TestClient(app)
+_ALLOWED_EVENTS = frozenset({
+    "status", "text_delta", "tool_use_start", "tool_result", "completion", "done",
+})
+_SSE_FRAME_RE = re.compile(rb"event: (\w+)\ndata: (.+)")
 
 
 def test_subagent_endpoint_reachable(client: TestClient, tmp_path: Path) -> None:
@@ -36,58 +36,52 @@ def test_subagent_endpoint_reachable(client: TestClient, tmp_path: Path) -> None
 
 def test_subagent_missing_auth_returns_error(client: TestClient, tmp_path: Path) -> None:
     """Test that missing auth credentials produce a graceful error in SSE format."""
-    response = client.post("/subagent/cad", json={
+    with client.stream("POST", "/subagent/cad", json={
         "prompt": "Create a box",
         "context": "",
         "project_root": str(tmp_path),
         "auth": {},
-    })
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/event-stream")
+    }) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
 
-    # Parse SSE events from the response body
-    body = response.text
-    events = _parse_sse_events(body)
+        # Parse SSE events as they arrive; reading stops after "done"
+        events = [
+            _parse_sse_block(block) for block in _iter_sse_blocks(response.iter_bytes())
+        ]
+
+    # First event of each type, built in one pass
+    by_type: dict[str, dict] = {}
+    for e in events:
+        by_type.setdefault(e["event"], e)
 
     # Should contain a completion event with error message
-    completion_events = [e for e in events if e["event"] == "completion"]
-    assert len(completion_events) >= 1
-    assert "No auth" in completion_events[0]["data"].get("text", "")
+    assert "completion" in by_type
+    assert "No auth" in by_type["completion"]["data"].get("text", "")
 
     # Should end with a done event
-    done_events = [e for e in events if e["event"] == "done"]
-    assert len(done_events) >= 1
+    assert events[-1]["event"] == "done"
 
 
 def test_subagent_sse_format(client: TestClient, tmp_path: Path) -> None:
     """Test that the SSE wire format is correct (event: + data: + blank line)."""
-    response = client.post("/subagent/cad", json={
+    with client.stream("POST", "/subagent/cad", json={
         "prompt": "Create a box",
         "project_root": str(tmp_path),
         "auth": {},
-    })
-    body = response.text
+    }) as response:
+        blocks = list(_iter_sse_blocks(response.iter_bytes()))
 
     # SSE events should follow the format: "event: <type>\ndata: <json>\n\n"
-    lines = body.split("\n")
-    i = 0
-    event_count = 0
-    while i < len(lines):
-        if lines[i].startswith("event: "):
-            event_type = lines[i][7:]
-            assert event_type in ("status", "text_delta", "tool_use_start", "tool_result", "completion", "done")
-            i += 1
-            if i < len(lines):
-                assert lines[i].startswith("data: "), f"Expected 'data: ' line after event line, got: {lines[i]}"
-                # Verify data is valid JSON
-                import json
-                json.loads(lines[i][6:])
-                i += 1
-            event_count += 1
-        else:
-            i += 1
-
-    assert event_count >= 2  # At least completion + done
+    assert len(blocks) >= 2  # At least completion + done
+    for block in blocks:
+        frame = _SSE_FRAME_RE.fullmatch(block)
+        assert frame is not None, f"Malformed SSE block: {block!r}"
+        event_type, data = frame[1].decode(), frame[2]
+        assert event_type in _ALLOWED_EVENTS
+        json.loads(data)
+        # The block parser must agree with the framing scan
+        assert _parse_sse_block(block)["event"] == event_type
 
 
 def test_subagent_request_validation(client: TestClient) -> None:
@@ -100,27 +94,33 @@ def test_subagent_request_validation(client: TestClient) -> None:
     assert response.status_code == 422  # Pydantic validation error
 
 
-def _parse_sse_events(body: str) -> list[dict]:
-    """Parse SSE events from response body."""
-    import json
-
-    events = []
-    lines = body.split("\n")
-    current_event = ""
-    current_data = ""
-
-    for line in lines:
-        if line.startswith("event: "):
-            current_event = line[7:].strip()
-        elif line.startswith("data: "):
-            current_data = line[6:]
-        elif line == "" and current_event:
-            try:
-                data = json.loads(current_data)
-            except json.JSONDecodeError:
-                data = {}
-            events.append({"event": current_event, "data": data})
-            current_event = ""
-            current_data = ""
-
-    return events
+def _iter_sse_blocks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield raw blank-line-delimited SSE blocks, stopping after ``done``."""
+    pending = b""
+    for chunk in chunks:
+        *blocks, pending = (pending + chunk).split(b"\n\n")
+        for block in blocks:
+            if not block:
+                continue
+            yield block
+            if block.startswith(b"event: done"):
+                return
+
+
+def _parse_sse_block(block: bytes) -> dict:
+    """Parse one SSE block into ``{"event": ..., "data": ...}``.
+
+    Only the event name is decoded; ``json.loads`` reads the payload bytes.
+    """
+    event = ""
+    data = b""
+    for line in block.split(b"\n"):
+        if line.startswith(b"event: "):
+            event = line[7:].strip().decode()
+        elif line.startswith(b"data: "):
+            data = line[6:]
+    try:
+        parsed = json.loads(data)
+    except json.JSONDecodeError:
+        parsed = {}
+    return {"event": event, "data": parsed}
@@ -7,78 +7,72 @@ import pytest
 from cadforge_engine.models.tasks import TaskModel, TaskStatus, TaskStore, TaskType
 
 
+@pytest.fixture
+def store() -> TaskStore:
+    return TaskStore()
+
+
 class TestTaskStore:
     """Test the in-memory task store."""
 
-    def test_create_task(self) -> None:
-        store = TaskStore()
+    def test_create_task(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD, "make a box")
         assert task.id
         assert task.type == TaskType.EXECUTE_CAD
         assert task.status == TaskStatus.PENDING
         assert task.prompt == "make a box"
 
-    def test_get_task(self) -> None:
-        store = TaskStore()
+    def test_get_task(self, store: TaskStore) -> None:
         task = store.create(TaskType.ANALYZE_MESH)
         fetched = store.get(task.id)
         assert fetched is not None
         assert fetched.id == task.id
 
-    def test_get_missing_task(self) -> None:
-        store = TaskStore()
+    def test_get_missing_task(self, store: TaskStore) -> None:
         assert store.get("nonexistent") is None
 
-    def test_update_status_running(self) -> None:
-        store = TaskStore()
+    def test_update_status_running(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.update_status(task.id, TaskStatus.RUNNING)
         assert task.status == TaskStatus.RUNNING
         assert task.started_at is not None
 
-    def test_update_status_completed(self) -> None:
-        store = TaskStore()
+    def test_update_status_completed(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.update_status(task.id, TaskStatus.RUNNING)
         store.update_status(task.id, TaskStatus.COMPLETED)
         assert task.status == TaskStatus.COMPLETED
         assert task.completed_at is not None
 
-    def test_update_status_failed(self) -> None:
-        store = TaskStore()
+    def test_update_status_failed(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.update_status(task.id, TaskStatus.FAILED)
         assert task.status == TaskStatus.FAILED
         assert task.completed_at is not None
 
-    def test_add_event(self) -> None:
-        store = TaskStore()
+    def test_add_event(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.add_event(task.id, {"event": "status", "data": {"message": "starting"}})
         assert len(task.events) == 1
         assert task.events[0]["event"] == "status"
 
-    def test_add_artifact(self) -> None:
-        store = TaskStore()
+    def test_add_artifact(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.add_artifact(task.id, "model.stl", "/tmp/model.stl")
         assert task.artifacts["model.stl"] == "/tmp/model.stl"
 
-    def test_set_result(self) -> None:
-        store = TaskStore()
+    def test_set_result(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.set_result(task.id, {"success": True, "output_path": "/tmp/out.stl"})
         assert task.result is not None
         assert task.result["success"] is True
 
-    def test_set_error(self) -> None:
-        store = TaskStore()
+    def test_set_error(self, store: TaskStore) -> None:
         task = store.create(TaskType.EXECUTE_CAD)
         store.set_error(task.id, "Something went wrong")
         assert task.error == "Something went wrong"
 
-    def test_list_all(self) -> None:
-        store = TaskStore()
+    def test_list_all(self, store: TaskStore) -> None:
         store.create(TaskType.EXECUTE_CAD, "task 1")
         store.create(TaskType.ANALYZE_MESH, "task 2")
         all_tasks = store.list_all()
@@ -2,31 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import shutil
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
-from cadforge_engine.app import create_app
 
-
-@pytest.fixture
-def client() -> TestClient:
-    app = create_app()
-    return TestClient(app)
+def _post_index(client: TestClient, project: Path) -> Response:
+    """POST a full (non-incremental) index request for *project*."""
+    return client.post("/vault/index", json={"project_root": str(project), "incremental": False})
 
 
-@pytest.fixture
-def tmp_project(tmp_path: Path) -> Path:
-    """Create a temporary project with a vault directory."""
-    vault_dir = tmp_path / "vault"
+@pytest.fixture(scope="module")
+def _vault_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample vault once per module."""
+    root = tmp_path_factory.mktemp("vault_tmpl")
+    vault_dir = root / "vault"
     vault_dir.mkdir()
     (vault_dir / "test.md").write_text(
         "---\ntags: [design, cad]\n---\n\n# Test Document\n\nThis is test content about gears.\n\n## Details\n\nGear teeth are important for mechanical design.\n",
         encoding="utf-8",
     )
-    return tmp_path
+    return root
+
+
+@pytest.fixture
+def tmp_project(_vault_template: Path, tmp_path: Path) -> Path:
+    """Create a temporary project with a vault directory."""
+    project = tmp_path / "proj"
+    shutil.copytree(_vault_template, project)
+    return project
+
+
+@pytest.fixture(scope="module")
+def indexed_project(
+    client: TestClient, _vault_template: Path, tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """A project whose vault is indexed once and then only searched."""
+    project = tmp_path_factory.mktemp("indexed") / "proj"
+    shutil.copytree(_vault_template, project)
+    response = _post_index(client, project)
+    assert response.status_code == 200
+    assert response.json()["success"]
+    return project
 
 
 def test_vault_search_no_vault(client: TestClient, tmp_path: Path) -> None:
@@ -51,10 +71,7 @@ def test_vault_search_fallback(client: TestClient, tmp_project: Path) -> None:
 
 
 def test_vault_index(client: TestClient, tmp_project: Path) -> None:
-    response = client.post("/vault/index", json={
-        "project_root": str(tmp_project),
-        "incremental": False,
-    })
+    response = _post_index(client, tmp_project)
     assert response.status_code == 200
     data = response.json()
     assert data["success"] is True
@@ -62,17 +79,10 @@ def test_vault_index(client: TestClient, tmp_project: Path) -> None:
     assert data["chunks_created"] >= 1
 
 
-def test_vault_index_then_search(client: TestClient, tmp_project: Path) -> None:
-    # Index first
-    client.post("/vault/index", json={
-        "project_root": str(tmp_project),
-        "incremental": False,
-    })
-
-    # Then search
+def test_vault_index_then_search(client: TestClient, indexed_project: Path) -> None:
     response = client.post("/vault/search", json={
         "query": "gear teeth mechanical",
-        "project_root": str(tmp_project),
+        "project_root": str(indexed_project),
     })
     assert response.status_code == 200
     data = response.json()
@@ -0,0 +1,37 @@
+import { describe, it, expect } from '@jest/globals';
+import { completeCommand } from '../../agent/completion.js';
+
+const NAMES = ['/agent', '/ask', '/exit', '/help', '/plan', '/sessions', '/skills'];
+
+describe('completeCommand', () => {
+  it('returns null when nothing matches', () => {
+    expect(completeCommand(NAMES, '/x')).toBeNull();
+  });
+
+  it('completes a unique match with a trailing space', () => {
+    expect(completeCommand(NAMES, '/he')).toBe('/help ');
+    expect(completeCommand(NAMES, '/help')).toBe('/help ');
+  });
+
+  it('extends several matches to their common prefix', () => {
+    expect(completeCommand(NAMES, '/a')).toBe('/a');
+    expect(completeCommand(NAMES, '/s')).toBe('/s');
+    expect(completeCommand(NAMES, '/se')).toBe('/sessions ');
+    expect(completeCommand(['/skill-a', '/skill-b'], '/s')).toBe('/skill-');
+  });
+
+  it('returns null for a prefix that sorts past the last name', () => {
+    expect(completeCommand(NAMES, '/z')).toBeNull();
+    expect(completeCommand(NAMES, '/skillsx')).toBeNull();
+  });
+
+  it('matches the first name in the list', () => {
+    expect(completeCommand(NAMES, '/ag')).toBe('/agent ');
+  });
+
+  it('ignores input that is not a bare slash command', () => {
+    expect(completeCommand(NAMES, 'help')).toBeNull();
+    expect(completeCommand(NAMES, '/help me')).toBeNull();
+    expect(completeCommand([], '/h')).toBeNull();
+  });
+});
@@ -0,0 +1,35 @@
+/**
+ * Slash-command completion for the REPL prompt.
+ */
+
+/**
+ * Complete a slash command against a sorted list of command names.
+ *
+ * Extends the input to the longest prefix shared by every match, adding
+ * a trailing space once the match is unique. Returns null when the input
+ * is not a bare slash command or nothing matches.
+ */
+export function completeCommand(sortedNames: readonly string[], text: string): string | null {
+  if (!text.startsWith('/') || text.includes(' ')) return null;
+
+  // Lower bound: first name >= text
+  let lo = 0;
+  let hi = sortedNames.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sortedNames[mid] < text) lo = mid + 1;
+    else hi = mid;
+  }
+  if (lo === sortedNames.length || !sortedNames[lo].startsWith(text)) return null;
+
+  let end = lo + 1;
+  while (end < sortedNames.length && sortedNames[end].startsWith(text)) end++;
+
+  // In sorted order the first and last matches bound the common prefix
+  const first = sortedNames[lo];
+  const last = sortedNames[end - 1];
+  let n = text.length;
+  while (n < first.length && first[n] === last[n]) n++;
+
+  return end - lo === 1 ? `${first} ` : first.slice(0, n);
+}
@@ -14,14 +14,26 @@ export const MODE_COLORS: Record<InteractionMode, string> = {
   ask: 'cyan',
 };
 
+/** Shift+Tab cycle: agent → plan → ask → agent. */
+const NEXT_MODE: Record<InteractionMode, InteractionMode> = {
+  agent: 'plan',
+  plan: 'ask',
+  ask: 'agent',
+};
+
 export function nextMode(mode: InteractionMode): InteractionMode {
-  const order: InteractionMode[] = ['agent', 'plan', 'ask'];
-  const idx = order.indexOf(mode);
-  return order[(idx + 1) % order.length];
+  return NEXT_MODE[mode];
 }
 
+/** Prompt prefixes, built once since the prompt redraws on every keystroke. */
+const MODE_PROMPT_PREFIX: Record<InteractionMode, string> = {
+  agent: 'cadforge:agent> ',
+  plan: 'cadforge:plan> ',
+  ask: 'cadforge:ask> ',
+};
+
 export function modePromptPrefix(mode: InteractionMode): string {
-  return `cadforge:${mode}> `;
+  return MODE_PROMPT_PREFIX[mode];
 }
 
 /** Read-only tools allowed in plan mode */
@@ -44,35 +56,41 @@ const PROCEED_PHRASES = new Set([
   'build it', 'make it', "let's go", 'start', 'run it',
 ]);
 
+/** All phrases folded into one alternation, so the input is scanned once. */
+const PROCEED_RE = new RegExp(
+  Array.from(PROCEED_PHRASES, (p) => p.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'),
+);
+
 export function hasProceedIntent(userInput: string): boolean {
-  const lower = userInput.toLowerCase().trim();
-  for (const phrase of PROCEED_PHRASES) {
-    if (lower.includes(phrase)) return true;
-  }
-  return false;
+  return PROCEED_RE.test(userInput.toLowerCase().trim());
 }
 
+/** Plan-mode rules, built once; treat as read-only. */
+const PLAN_MODE_PERMISSIONS: PermissionsConfig = {
+  deny: [
+    'WriteFile(*)',
+    'ExecuteCadQuery(*)',
+    'ExportModel(*)',
+    'AnalyzeMesh(*)',
+    'ShowPreview(*)',
+    'SearchWeb(*)',
+  ],
+  allow: [
+    'ReadFile(*)',
+    'ListFiles(*)',
+    'SearchVault(*)',
+    'GetPrinter(*)',
+    'Task(*)',
+    'Bash(*)',
+  ],
+  ask: [],
+};
+
 /**
  * Return permissions that deny write tools and allow read tools (for plan mode).
+ *
+ * The same object is returned on every call; callers must not mutate it.
  */
 export function getPlanModePermissions(): PermissionsConfig {
-  return {
-    deny: [
-      'WriteFile(*)',
-      'ExecuteCadQuery(*)',
-      'ExportModel(*)',
-      'AnalyzeMesh(*)',
-      'ShowPreview(*)',
-      'SearchWeb(*)',
-    ],
-    allow: [
-      'ReadFile(*)',
-      'ListFiles(*)',
-      'SearchVault(*)',
-      'GetPrinter(*)',
-      'Task(*)',
-      'Bash(*)',
-    ],
-    ask: [],
-  };
+  return PLAN_MODE_PERMISSIONS;
 }
@@ -9,13 +9,10 @@ import { existsSync } from 'node:fs';
 import { join } from 'node:path';
 import { PassThrough } from 'node:stream';
 import { Command, Flags } from '@oclif/core';
-import React from 'react';
-import { render } from 'ink';
 import { findProjectRoot } from '../config/paths.js';
 import { loadSettings } from '../config/settings.js';
 import { BackendManager } from '../backend/manager.js';
 import { resolveAuthForProvider } from '../llm/auth.js';
-import { App } from '../ui/App.js';
 
 export default class Chat extends Command {
   static override description = 'Start interactive CadForge REPL';
@@ -71,6 +68,14 @@ export default class Chat extends Command {
         stdin = passthrough as unknown as NodeJS.ReadStream;
       }
 
+      // Imported here so other commands, which oclif loads alongside this
+      // one, don't pay for React, Ink and the agent stack at startup.
+      const [{ default: React }, { render }, { App }] = await Promise.all([
+        import('react'),
+        import('ink'),
+        import('../ui/App.js'),
+      ]);
+
       // Render Ink app
       const app = render(
         React.createElement(App, {
@@ -6,7 +6,7 @@
  * the Zustand store so the Permission component handles Y/N input.
  */
 
-import React, { useEffect, useRef, useMemo } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { Box, useApp } from 'ink';
 import type { StoreApi } from 'zustand';
 import type { CadForgeSettings } from '@cadforge/shared';
@@ -14,6 +14,7 @@ import { Agent } from '../agent/agent.js';
 import { Session } from '../session/session.js';
 import type { BackendClient } from '../backend/client.js';
 import { discoverSkills, getSlashCommands } from '../skills/loader.js';
+import type { Skill } from '../skills/loader.js';
 import { Welcome } from './Welcome.js';
 import { Repl } from './Repl.js';
 import { createUIStore } from './store.js';
@@ -81,8 +82,12 @@ export function App({
   }
   const agent = agentRef.current;
 
-  // Discover skills
-  const slashCommands = useMemo(() => getSlashCommands(projectRoot), [projectRoot]);
+  // Discover skills after the first paint so the welcome banner and prompt
+  // aren't held up by the skills directory scan.
+  const [slashCommands, setSlashCommands] = useState<Map<string, Skill>>(() => new Map());
+  useEffect(() => {
+    setSlashCommands(getSlashCommands(projectRoot));
+  }, [projectRoot]);
 
   // Cleanup on unmount
   useEffect(() => {
@@ -13,13 +13,16 @@ interface PromptInputProps {
   mode: InteractionMode;
   isProcessing: boolean;
   onSubmit: (text: string) => void;
+  /** Tab completion: returns the completed input, or null for no match. */
+  onComplete?: (text: string) => string | null;
 }
 
-export function PromptInput({ mode, isProcessing, onSubmit }: PromptInputProps): React.ReactElement {
+export function PromptInput({ mode, isProcessing, onSubmit, onComplete }: PromptInputProps): React.ReactElement {
   const { isRawModeSupported } = useStdin();
   const [value, setValue] = useState('');
   const [cursor, setCursor] = useState(0);
-  const [continuation, setContinuation] = useState<string[]>([]);
+  // Lines entered so far with backslash continuation, each ending in '\n'
+  const [continuation, setContinuation] = useState('');
 
   const handleSubmit = useCallback(() => {
     const trimmed = value.trim();
@@ -27,19 +30,17 @@ export function PromptInput({ mode, isProcessing, onSubmit }: PromptInputProps):
 
     // Backslash continuation
     if (trimmed.endsWith('\\')) {
-      setContinuation((prev) => [...prev, trimmed.slice(0, -1)]);
+      setContinuation((prev) => prev + trimmed.slice(0, -1) + '\n');
       setValue('');
       setCursor(0);
       return;
     }
 
-    const fullInput = continuation.length > 0
-      ? [...continuation, trimmed].join('\n')
-      : trimmed;
+    const fullInput = continuation + trimmed;
 
     setValue('');
     setCursor(0);
-    setContinuation([]);
+    setContinuation('');
     onSubmit(fullInput);
   }, [value, continuation, onSubmit]);
 
@@ -92,10 +93,21 @@ export function PromptInput({ mode, isProcessing, onSubmit }: PromptInputProps):
       return;
     }
 
+    // Tab completion (Shift+Tab is the REPL's mode cycle)
+    if (key.tab) {
+      if (!key.shift && onComplete) {
+        const completed = onComplete(value);
+        if (completed !== null) {
+          setValue(completed);
+          setCursor(completed.length);
+        }
+      }
+      return;
+    }
+
     // Ignore other control sequences
     if (key.ctrl || key.meta || key.escape) return;
     if (key.upArrow || key.downArrow) return;
-    if (key.tab) return;
 
     // Regular character input
     if (input) {
@@ -122,9 +134,9 @@ export function PromptInput({ mode, isProcessing, onSubmit }: PromptInputProps):
 
   return (
     <Box flexDirection="column">
-      {continuation.length > 0 && (
+      {continuation !== '' && (
         <Box marginLeft={2}>
-          <Text dimColor>{continuation.map((l) => l + '\\').join('\n')}</Text>
+          <Text dimColor>{continuation.slice(0, -1).replaceAll('\n', '\\\n') + '\\'}</Text>
         </Box>
       )}
       <Box>
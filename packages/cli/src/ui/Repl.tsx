@@ -6,14 +6,17 @@
  * from plan -> agent on proceed intent.
  */
 
-import React, { useState, useCallback, useRef, useEffect } from 'react';
+import { spawn } from 'node:child_process';
+import React, { useState, useCallback, useRef, useEffect, useMemo } from 'react';
 import { Box, Text, useInput, useStdin, useApp } from 'ink';
+import type { Key } from 'ink';
 import { useStore } from 'zustand';
 import type { StoreApi } from 'zustand';
 import { getDefaultSubagentModel } from '@cadforge/shared';
 import type { Agent } from '../agent/agent.js';
 import type { InteractionMode } from '../agent/modes.js';
 import { nextMode, hasProceedIntent, MODE_COLORS } from '../agent/modes.js';
+import { completeCommand } from '../agent/completion.js';
 import type { Skill } from '../skills/loader.js';
 import { PromptInput } from './PromptInput.js';
 import { StreamingText } from './StreamingText.js';
@@ -51,14 +54,30 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
   const abortRef = useRef<AbortController | null>(null);
   const onEventRef = useRef(createEventHandler(store));
 
+  // Skills don't change during a session, so /help and /skills share one listing.
+  const skillsListing = useMemo(() => formatSkills(slashCommands), [slashCommands]);
+
+  // Sorted once so Tab completion can binary-search the matching range.
+  const commandNames = useMemo(
+    () => [...BUILTIN_COMMANDS.keys(), '/provider', ...slashCommands.keys()].sort(),
+    [slashCommands],
+  );
+  const handleComplete = useCallback(
+    (text: string) => completeCommand(commandNames, text),
+    [commandNames],
+  );
+
   // --- Ctrl+C and Shift+Tab ---
-  useInput((input, key) => {
+  // Reads live state from the store so the handler stays stable; Ink
+  // re-subscribes its stdin listener whenever the handler changes.
+  const handleKey = useCallback((input: string, key: Key) => {
     // Ctrl+C — cancel running agent or exit
     if (input === 'c' && key.ctrl) {
+      const { isProcessing } = store.getState();
       if (isProcessing && abortRef.current) {
         abortRef.current.abort();
       } else if (!isProcessing) {
-        cleanup();
+        agent.saveSession();
         exit();
       }
       return;
@@ -66,13 +85,14 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
 
     // Shift+Tab — cycle modes (only when not processing)
     if (key.tab && key.shift) {
-      if (!isProcessing) {
-        const next = nextMode(mode);
-        store.getState().setMode(next);
+      const state = store.getState();
+      if (!state.isProcessing) {
+        state.setMode(nextMode(state.mode));
       }
       return;
     }
-  }, { isActive: isRawModeSupported });
+  }, [store, agent, exit]);
+  useInput(handleKey, { isActive: isRawModeSupported });
 
   // Clear error after 5s
   useEffect(() => {
@@ -82,10 +102,6 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
     }
   }, [error, store]);
 
-  function cleanup() {
-    agent.saveSession();
-  }
-
   // --- Process user input ---
   const handleSubmit = useCallback(async (rawInput: string) => {
     const input = rawInput.trim();
@@ -95,52 +111,22 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
 
     // Shell shortcut: !command
     if (input.startsWith('!')) {
-      await handleShellCommand(input.slice(1), state);
+      const controller = new AbortController();
+      abortRef.current = controller;
+      state.setProcessing(true);
+      try {
+        await handleShellCommand(input.slice(1), state, controller.signal);
+      } finally {
+        abortRef.current = null;
+        store.getState().setProcessing(false);
+      }
       return;
     }
 
     // Built-in commands
-    if (input === '/quit' || input === '/exit') {
-      cleanup();
-      exit();
-      return;
-    }
-
-    if (input === '/help') {
-      showHelp(state, mode, slashCommands, agent);
-      return;
-    }
-
-    if (input === '/agent') {
-      state.setMode('agent');
-      state.addAssistantMessage('Switched to AGENT mode.');
-      return;
-    }
-
-    if (input === '/plan') {
-      state.setMode('plan');
-      state.addAssistantMessage('Switched to PLAN mode.');
-      return;
-    }
-
-    if (input === '/ask') {
-      state.setMode('ask');
-      state.addAssistantMessage('Switched to ASK mode.');
-      return;
-    }
-
-    if (input === '/mode') {
-      state.addAssistantMessage(`Current mode: ${mode}`);
-      return;
-    }
-
-    if (input === '/skills') {
-      showSkills(state, slashCommands);
-      return;
-    }
-
-    if (input === '/sessions') {
-      showSessions(state, agent);
+    const builtin = BUILTIN_COMMANDS.get(input);
+    if (builtin) {
+      builtin({ state, mode, agent, skillsListing, exit });
       return;
     }
 
@@ -195,7 +181,7 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
       abortRef.current = null;
       store.getState().setProcessing(false);
     }
-  }, [agent, store, mode, slashCommands, exit]);
+  }, [agent, store, mode, slashCommands, skillsListing, exit]);
 
   return (
     <Box flexDirection="column">
@@ -244,6 +230,7 @@ export function Repl({ store, agent, model, slashCommands, projectRoot }: ReplPr
         mode={mode}
         isProcessing={isProcessing}
         onSubmit={handleSubmit}
+        onComplete={handleComplete}
       />
     </Box>
   );
@@ -284,59 +271,152 @@ function MessageList({ messages }: MessageListProps): React.ReactElement | null
 // Command handlers
 // ---------------------------------------------------------------------------
 
-async function handleShellCommand(
+interface CommandContext {
+  state: UIStore;
+  mode: InteractionMode;
+  agent: Agent;
+  skillsListing: string;
+  exit: () => void;
+}
+
+type CommandHandler = (ctx: CommandContext) => void;
+
+/** Modes that can be selected directly with /<mode>. */
+const MODE_COMMANDS: readonly InteractionMode[] = ['agent', 'plan', 'ask'];
+
+/** Exact-match built-in commands, looked up once per submitted line. */
+const BUILTIN_COMMANDS: ReadonlyMap<string, CommandHandler> = new Map<string, CommandHandler>([
+  ['/quit', quit],
+  ['/exit', quit],
+  ['/help', ({ state, mode, skillsListing, agent }) => showHelp(state, mode, skillsListing, agent)],
+  ...MODE_COMMANDS.map((m): [string, CommandHandler] => [`/${m}`, (ctx) => switchMode(ctx, m)]),
+  ['/mode', ({ state, mode }) => state.addAssistantMessage(`Current mode: ${mode}`)],
+  ['/skills', ({ state, skillsListing }) => showSkills(state, skillsListing)],
+  ['/sessions', ({ state, agent }) => showSessions(state, agent)],
+]);
+
+function quit({ agent, exit }: CommandContext): void {
+  agent.saveSession();
+  exit();
+}
+
+function switchMode({ state }: CommandContext, mode: InteractionMode): void {
+  state.setMode(mode);
+  state.addAssistantMessage(`Switched to ${mode.toUpperCase()} mode.`);
+}
+
+
+/** Caps on captured output, so a noisy command can't grow memory unbounded. */
+const MAX_SHELL_STDOUT = 30_000;
+const MAX_SHELL_STDERR = 10_000;
+
+function handleShellCommand(
   command: string,
   state: UIStore,
+  signal: AbortSignal,
 ): Promise<void> {
   const trimmed = command.trim();
   if (!trimmed) {
     state.addAssistantMessage('Usage: !<command>');
-    return;
+    return Promise.resolve();
   }
 
-  const { execSync } = await import('node:child_process');
-  try {
-    const result = execSync(trimmed, {
-      encoding: 'utf-8',
+  return new Promise((resolve) => {
+    // Async spawn keeps the UI responsive (and Ctrl+C live) while the
+    // command runs; output is reported once, when it finishes.
+    const child = spawn(trimmed, {
+      shell: true,
       timeout: 120_000,
-      stdio: ['pipe', 'pipe', 'pipe'],
+      signal,
+      stdio: ['ignore', 'pipe', 'pipe'],
     });
-    if (result.trim()) {
-      state.addAssistantMessage(result.trimEnd());
+    let stdout = '';
+    let stdoutTotal = 0;
+    let stderr = '';
+    let settled = false;
+
+    // An aborted child emits both 'error' and 'close'; report only the first
+    function finish(report: () => void): void {
+      if (settled) return;
+      settled = true;
+      report();
+      resolve();
     }
-  } catch (e) {
-    const err = e as { stderr?: string; message?: string };
-    state.setError(err.stderr?.trimEnd() ?? err.message ?? 'Shell command failed');
-  }
+
+    child.stdout.setEncoding('utf-8');
+    child.stderr.setEncoding('utf-8');
+    child.stdout.on('data', (chunk: string) => {
+      stdoutTotal += chunk.length;
+      if (stdout.length < MAX_SHELL_STDOUT) {
+        stdout = (stdout + chunk).slice(0, MAX_SHELL_STDOUT);
+      }
+    });
+    child.stderr.on('data', (chunk: string) => {
+      if (stderr.length < MAX_SHELL_STDERR) {
+        stderr = (stderr + chunk).slice(0, MAX_SHELL_STDERR);
+      }
+    });
+
+    child.on('error', (err) => finish(() => {
+      if (signal.aborted) {
+        state.addAssistantMessage('Cancelled.');
+      } else {
+        state.setError(err.message);
+      }
+    }));
+
+    child.on('close', (code, sig) => finish(() => {
+      if (signal.aborted) {
+        state.addAssistantMessage('Cancelled.');
+      } else if (code !== 0) {
+        state.setError(stderr.trimEnd() || `Shell command failed (${code ?? sig})`);
+      } else if (stdout.trim()) {
+        const truncated = stdoutTotal > MAX_SHELL_STDOUT
+          ? `\n... (truncated, ${stdoutTotal} total chars)`
+          : '';
+        state.addAssistantMessage(stdout.trimEnd() + truncated);
+      }
+    }));
+  });
+}
+
+const HELP_COMMANDS =
+  'Modes:\n' +
+  '  /agent  — Full agentic loop with all tools\n' +
+  '  /plan   — Read-only, generates plans without modifying files\n' +
+  '  /ask    — Pure Q&A, no tools, answers from knowledge\n' +
+  '  /mode   — Show current mode\n\n' +
+  'Commands:\n' +
+  '  /help     — Show this help\n' +
+  '  /provider — Show or switch LLM provider\n' +
+  '  /skills   — List available skills\n' +
+  '  /sessions — List recent sessions\n' +
+  '  /quit     — Exit CadForge\n\n' +
+  'Shortcuts:\n' +
+  '  Tab       — Complete slash command\n' +
+  '  Shift+Tab — Cycle modes (agent -> plan -> ask)\n' +
+  '  Ctrl+C    — Cancel running agent / exit\n' +
+  '  !command  — Run shell command directly\n' +
+  '  \\         — Continue on next line\n';
+
+/** One line per skill command, or '' when there are none. */
+function formatSkills(slashCommands: Map<string, Skill>): string {
+  return [...slashCommands.entries()]
+    .map(([cmd, skill]) => `  ${cmd} — ${skill.description}`)
+    .join('\n');
 }
 
 function showHelp(
   state: UIStore,
   mode: InteractionMode,
-  slashCommands: Map<string, Skill>,
+  skillsListing: string,
   agent: Agent,
 ): void {
   const settings = agent.settings;
   const provider = settings.provider;
   const sm = settings.subagentModels;
 
-  let help = `Current Mode: ${mode}\n\n` +
-    'Modes:\n' +
-    '  /agent  — Full agentic loop with all tools\n' +
-    '  /plan   — Read-only, generates plans without modifying files\n' +
-    '  /ask    — Pure Q&A, no tools, answers from knowledge\n' +
-    '  /mode   — Show current mode\n\n' +
-    'Commands:\n' +
-    '  /help     — Show this help\n' +
-    '  /provider — Show or switch LLM provider\n' +
-    '  /skills   — List available skills\n' +
-    '  /sessions — List recent sessions\n' +
-    '  /quit     — Exit CadForge\n\n' +
-    'Shortcuts:\n' +
-    '  Shift+Tab — Cycle modes (agent -> plan -> ask)\n' +
-    '  Ctrl+C    — Cancel running agent / exit\n' +
-    '  !command  — Run shell command directly\n' +
-    '  \\         — Continue on next line\n';
+  let help = `Current Mode: ${mode}\n\n` + HELP_COMMANDS;
 
   help += '\nSubagent Models:\n' +
     `  explore — ${sm.explore ?? getDefaultSubagentModel(provider, 'explore')}${sm.explore ? '' : ' (default)'}\n` +
@@ -345,24 +425,15 @@ function showHelp(
     '  Configure in ~/.cadforge/settings.json or .cadforge/settings.json:\n' +
     '  { "subagent_models": { "explore": "model", "plan": "model", "cad": "model" } }\n';
 
-  if (slashCommands.size > 0) {
-    help += '\nSkills:\n';
-    for (const [cmd, skill] of slashCommands) {
-      help += `  ${cmd} — ${skill.description}\n`;
-    }
+  if (skillsListing) {
+    help += `\nSkills:\n${skillsListing}\n`;
   }
 
   state.addAssistantMessage(help);
 }
 
-function showSkills(state: UIStore, slashCommands: Map<string, Skill>): void {
-  if (slashCommands.size === 0) {
-    state.addAssistantMessage('No skills found.');
-    return;
-  }
-  const lines = [...slashCommands.entries()]
-    .map(([cmd, skill]) => `  ${cmd} — ${skill.description}`);
-  state.addAssistantMessage(lines.join('\n'));
+function showSkills(state: UIStore, skillsListing: string): void {
+  state.addAssistantMessage(skillsListing || 'No skills found.');
 }
 
 function showSessions(state: UIStore, agent: Agent): void {
@@ -377,9 +448,13 @@ function showSessions(state: UIStore, agent: Agent): void {
   state.addAssistantMessage(lines.join('\n'));
 }
 
+const VALID_PROVIDERS = ['anthropic', 'openai', 'ollama', 'bedrock'] as const;
+type ValidProvider = typeof VALID_PROVIDERS[number];
+const PROVIDER_SET: ReadonlySet<string> = new Set(VALID_PROVIDERS);
+
 function handleProvider(input: string, state: UIStore, agent: Agent): void {
-  const VALID_PROVIDERS = ['anthropic', 'openai', 'ollama', 'bedrock'] as const;
-  const parts = input.split(/\s+/);
+  // Only "/provider <name> [model]" matters; stop splitting after three tokens
+  const parts = input.split(/\s+/, 3);
 
   if (parts.length === 1) {
     // Show current provider info
@@ -392,13 +467,13 @@ function handleProvider(input: string, state: UIStore, agent: Agent): void {
     return;
   }
 
-  const providerName = parts[1] as typeof VALID_PROVIDERS[number];
-  if (!VALID_PROVIDERS.includes(providerName)) {
+  if (!PROVIDER_SET.has(parts[1])) {
     state.addAssistantMessage(
       `Unknown provider: ${parts[1]}\nValid providers: ${VALID_PROVIDERS.join(', ')}`,
     );
     return;
   }
+  const providerName = parts[1] as ValidProvider;
 
   const model = parts[2] ?? undefined; // optional model override
   agent.switchProvider(providerName, model);
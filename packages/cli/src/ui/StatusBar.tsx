@@ -17,7 +17,9 @@ interface StatusBarProps {
   isProcessing: boolean;
 }
 
-export function StatusBar({
+// Props are all primitives, so the shallow compare in React.memo skips
+// redraws whenever the parent re-renders with an unchanged bar.
+export const StatusBar = React.memo(function StatusBar({
   mode,
   model,
   statusText,
@@ -43,7 +45,7 @@ export function StatusBar({
       </Text>
     </Box>
   );
-}
+});
 
 function formatTokens(n: number): string {
   if (n >= 1000) return `${(n / 1000).toFixed(1)}k`;
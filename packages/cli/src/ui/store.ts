@@ -146,119 +146,147 @@ function nextMsgId(): string {
   return `msg-${++msgIdCounter}`;
 }
 
-export function createUIStore() {
-  return createStore<UIStore>((set, get) => ({
-    ...initialState,
+/** Text deltas are published to the store at most once per frame (~60 fps). */
+const STREAM_FRAME_MS = 16;
 
-    appendTextDelta(text: string) {
+export function createUIStore() {
+  return createStore<UIStore>((set, get) => {
+    // Deltas collected since the last publish; fast streams then cost one
+    // re-render per frame rather than one per token.
+    let pendingText = '';
+    let publishTimer: ReturnType<typeof setTimeout> | null = null;
+
+    function publishPendingText(): void {
+      if (publishTimer !== null) {
+        clearTimeout(publishTimer);
+        publishTimer = null;
+      }
+      if (!pendingText) return;
+      const text = pendingText;
+      pendingText = '';
       set((s) => ({ streamingText: s.streamingText + text }));
-    },
+    }
 
-    flushStreamingText() {
-      const { streamingText } = get();
-      if (streamingText) {
+    return {
+      ...initialState,
+
+      appendTextDelta(text: string) {
+        pendingText += text;
+        publishTimer ??= setTimeout(publishPendingText, STREAM_FRAME_MS);
+      },
+
+      flushStreamingText() {
+        publishPendingText();
+        const { streamingText } = get();
+        if (streamingText) {
+          set((s) => ({
+            messages: [
+              ...s.messages,
+              { id: nextMsgId(), role: 'assistant', content: streamingText, timestamp: Date.now() },
+            ],
+            streamingText: '',
+          }));
+        }
+      },
+
+      addUserMessage(content: string) {
         set((s) => ({
           messages: [
             ...s.messages,
-            { id: nextMsgId(), role: 'assistant', content: streamingText, timestamp: Date.now() },
+            { id: nextMsgId(), role: 'user', content, timestamp: Date.now() },
           ],
-          streamingText: '',
         }));
-      }
-    },
-
-    addUserMessage(content: string) {
-      set((s) => ({
-        messages: [
-          ...s.messages,
-          { id: nextMsgId(), role: 'user', content, timestamp: Date.now() },
-        ],
-      }));
-    },
-
-    addAssistantMessage(content: string) {
-      set((s) => ({
-        messages: [
-          ...s.messages,
-          { id: nextMsgId(), role: 'assistant', content, timestamp: Date.now() },
-        ],
-      }));
-    },
-
-    addToolUse(id: string, name: string, input: Record<string, unknown>) {
-      set((s) => ({
-        toolPanels: [
-          ...s.toolPanels,
-          { id, name, input, status: 'running', collapsed: false },
-        ],
-      }));
-    },
-
-    updateToolResult(id: string, result: string, isError: boolean) {
-      set((s) => ({
-        toolPanels: s.toolPanels.map((tp) =>
-          tp.id === id
-            ? { ...tp, status: isError ? 'error' as const : 'done' as const, result, collapsed: true }
-            : tp,
-        ),
-      }));
-    },
-
-    toggleToolCollapsed(id: string) {
-      set((s) => ({
-        toolPanels: s.toolPanels.map((tp) =>
-          tp.id === id ? { ...tp, collapsed: !tp.collapsed } : tp,
-        ),
-      }));
-    },
-
-    setMode(mode: InteractionMode) {
-      set({ mode });
-    },
-
-    setProcessing(processing: boolean) {
-      set({ isProcessing: processing });
-      if (!processing) {
-        set({ statusText: '', toolPanels: [] });
-      }
-    },
+      },
+
+      addAssistantMessage(content: string) {
+        set((s) => ({
+          messages: [
+            ...s.messages,
+            { id: nextMsgId(), role: 'assistant', content, timestamp: Date.now() },
+          ],
+        }));
+      },
 
-    setStatus(text: string) {
-      set({ statusText: text });
-    },
+      addToolUse(id: string, name: string, input: Record<string, unknown>) {
+        set((s) => ({
+          toolPanels: [
+            ...s.toolPanels,
+            { id, name, input, status: 'running', collapsed: false },
+          ],
+        }));
+      },
 
-    setPermissionRequest(req: PermissionRequest | null) {
-      set({ permissionRequest: req });
-    },
+      updateToolResult(id: string, result: string, isError: boolean) {
+        set((s) => ({
+          toolPanels: s.toolPanels.map((tp) =>
+            tp.id === id
+              ? { ...tp, status: isError ? 'error' as const : 'done' as const, result, collapsed: true }
+              : tp,
+          ),
+        }));
+      },
 
-    resolvePermission(allowed: boolean) {
-      const { permissionRequest } = get();
-      if (permissionRequest) {
-        permissionRequest.resolve(allowed);
-        set({ permissionRequest: null });
-      }
-    },
-
-    setError(error: string | null) {
-      set({ error });
-    },
-
-    setAuthSource(source: string) {
-      set({ authSource: source });
-    },
-
-    addUsage(input: number, output: number) {
-      set((s) => ({
-        totalInputTokens: s.totalInputTokens + input,
-        totalOutputTokens: s.totalOutputTokens + output,
-      }));
-    },
-
-    reset() {
-      msgIdCounter = 0;
-      set({ ...initialState });
-    },
-  }));
+      toggleToolCollapsed(id: string) {
+        set((s) => ({
+          toolPanels: s.toolPanels.map((tp) =>
+            tp.id === id ? { ...tp, collapsed: !tp.collapsed } : tp,
+          ),
+        }));
+      },
+
+      setMode(mode: InteractionMode) {
+        set({ mode });
+      },
+
+      setProcessing(processing: boolean) {
+        set({ isProcessing: processing });
+        if (!processing) {
+          set({ statusText: '', toolPanels: [] });
+        }
+      },
+
+      setStatus(text: string) {
+        set({ statusText: text });
+      },
+
+      setPermissionRequest(req: PermissionRequest | null) {
+        set({ permissionRequest: req });
+      },
+
+      resolvePermission(allowed: boolean) {
+        const { permissionRequest } = get();
+        if (permissionRequest) {
+          permissionRequest.resolve(allowed);
+          set({ permissionRequest: null });
+        }
+      },
+
+      setError(error: string | null) {
+        set({ error });
+      },
+
+      setAuthSource(source: string) {
+        set({ authSource: source });
+      },
+
+      addUsage(input: number, output: number) {
+        set((s) => ({
+          totalInputTokens: s.totalInputTokens + input,
+          totalOutputTokens: s.totalOutputTokens + output,
+        }));
+      },
+
+      reset() {
+        msgIdCounter = 0;
+        pendingText = '';
+        if (publishTimer !== null) {
+          clearTimeout(publishTimer);
+          publishTimer = null;
+        }
+        set({ ...initialState });
+      },
+    };
+  });
 }
 
 // ---------------------------------------------------------------------------
@@ -269,15 +297,16 @@ export function createEventHandler(store: ReturnType<typeof createUIStore>) {
   return function onEvent(event: AgentEvent): void {
     const state = store.getState();
 
+    // Cases are ordered by frequency: a streamed reply is mostly TEXT_DELTA.
     switch (event.type) {
-      case EventType.STATUS:
-        state.setStatus((event.data.message as string) ?? '');
-        break;
-
       case EventType.TEXT_DELTA:
         state.appendTextDelta((event.data.text as string) ?? '');
         break;
 
+      case EventType.STATUS:
+        state.setStatus((event.data.message as string) ?? '');
+        break;
+
       case EventType.TEXT:
         // Complete text block (non-streaming fallback)
         break;